@@ -7,22 +7,188 @@ Note: This version analyzes available data without fetching external price data.
 
 import json
 import os
+import pickle
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, OrderedDict, namedtuple
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 import time
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# One alert occurrence from a snapshot file
+AlertRow = namedtuple('AlertRow', ['ticker', 'timestamp', 'current_price', 'change_pct', 'alert_type', 'alert_data'])
+
+# Bump whenever _parse_alert_file's output changes, so parsed file caches from older code are discarded
+PARSED_CACHE_VERSION = 2
+
+# Compact codes for the alert_type column of the columnar alert index
+ALERT_TYPE_CODES = {'price_spike': 0, 'premarket_volume': 1, 'premarket_price': 2}
+
+# Top-level keys of an alerts_*.json snapshot that the validator actually reads
+ALERT_SNAPSHOT_KEYS = ('timestamp', 'price_spikes', 'premarket_volume_alerts', 'premarket_price_alerts')
+
+
+def _json_loads(raw):
+    """Decode JSON bytes/str, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode obj as indented JSON bytes, stringifying anything non-native like json.dump(default=str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                   orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(obj, indent=2, default=str).encode()
+
+
+def _load_alert_snapshot(f) -> Dict:
+    """Read only ALERT_SNAPSHOT_KEYS from an alerts_*.json file opened in binary mode.
+
+    With ijson the other top-level values (volume_climbers, summary, ...) are
+    tokenized but never built into Python objects.
+    """
+    if not IJSON_AVAILABLE:
+        data = _json_loads(f.read())
+        return {key: data[key] for key in ALERT_SNAPSHOT_KEYS if key in data}
+
+    snapshot = {}
+    builder = None
+    building_key = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == building_key and event in ('end_array', 'end_map'):
+                snapshot[building_key] = builder.value
+                builder = None
+        elif prefix in ALERT_SNAPSHOT_KEYS and event != 'map_key':
+            if event in ('start_array', 'start_map'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                building_key = prefix
+            else:
+                snapshot[prefix] = value
+    return snapshot
+
+
+@lru_cache(maxsize=100_000)
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse timestamp from various formats (memoized; snapshots share timestamp strings)"""
+    # ISO format is by far the most common, so try it without raising first
+    if timestamp_str.endswith('Z'):
+        return datetime.fromisoformat(timestamp_str[:-1] + '+00:00')
+    try:
+        return datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        pass
+    
+    # Try other common formats
+    for fmt in ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"]:
+        try:
+            return datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Could not parse timestamp: {timestamp_str}")
+
+
+def _to_epoch_ns(values) -> np.ndarray:
+    """Convert datetimes to int64 nanoseconds since the epoch (tz-aware values are taken in UTC)"""
+    return pd.DatetimeIndex(values).as_unit('ns').asi8
+
+
+def _prefetch_files(paths):
+    """Ask the kernel to start reading files in the background (no-op where posix_fadvise is missing)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _parse_alert_file(file_path) -> Tuple[Optional[str], List[tuple]]:
+    """
+    Parse one alerts_*.json file into (date_key, alerts); runs inside a worker process
+    Alerts are plain tuples of AlertRow's fields, so they pickle (back from the worker and into the parsed
+    file cache) the same way whatever name this module was imported under
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            data = _load_alert_snapshot(f)
+        
+        timestamp = _parse_timestamp(data['timestamp'])
+        date_key = timestamp.strftime('%Y-%m-%d')
+        
+        # Extract all tickers that appeared in any alert type
+        all_tickers = []
+        
+        # Price spikes
+        for alert in data.get('price_spikes', []):
+            all_tickers.append((alert['ticker'], timestamp, alert['current_price'],
+                                alert['change_pct'], 'price_spike', alert))
+        
+        # Premarket volume alerts
+        for alert in data.get('premarket_volume_alerts', []):
+            all_tickers.append((alert['ticker'], timestamp, alert['current_price'],
+                                alert.get('premarket_change', 0), 'premarket_volume', alert))
+        
+        # Premarket price alerts
+        for alert in data.get('premarket_price_alerts', []):
+            all_tickers.append((alert['ticker'], timestamp, alert['current_price'],
+                                alert.get('premarket_change', 0), 'premarket_price', alert))
+        
+        return date_key, all_tickers
+        
+    except Exception as e:
+        print(f"Error processing file {file_path}: {e}")
+        return None, []
+
+
 class AlertValidator:
     def __init__(self, momentum_data_dir: str = "momentum_data"):
         self.momentum_data_dir = Path(momentum_data_dir)
         self.telegram_last_sent_file = self.momentum_data_dir / "telegram_last_sent.json"
         self.validation_cache_file = self.momentum_data_dir / "validation_cache.json"
+        self.parsed_cache_file = self.momentum_data_dir / ".parsed_cache.pkl"
         
         # Track first alert times for each ticker
         self.first_alerts = {}  # ticker -> (timestamp, alert_data)
         
+        # Every alert, sorted by (ticker, time), as parallel arrays plus the matching AlertRows
+        self.alert_columns = None
+        self.alert_rows = []
+        
+        # date -> ticker -> slice of alert_columns holding that ticker's alerts on that date
+        self.ticker_groups = defaultdict(dict)
+        
         # Track telegram send times
         self.telegram_sent_times = self._load_telegram_times()
         
@@ -33,8 +199,8 @@ class AlertValidator:
         """Load telegram send times from telegram_last_sent.json"""
         if self.telegram_last_sent_file.exists():
             try:
-                with open(self.telegram_last_sent_file, 'r') as f:
-                    return json.load(f)
+                with open(self.telegram_last_sent_file, 'rb') as f:
+                    return _json_loads(f.read())
             except Exception as e:
                 print(f"Warning: Could not load telegram times: {e}")
         return {}
@@ -43,8 +209,8 @@ class AlertValidator:
         """Load validation cache to avoid re-fetching price data"""
         if self.validation_cache_file.exists():
             try:
-                with open(self.validation_cache_file, 'r') as f:
-                    return json.load(f)
+                with open(self.validation_cache_file, 'rb') as f:
+                    return _json_loads(f.read())
             except Exception as e:
                 print(f"Warning: Could not load cache: {e}")
         return {}
@@ -52,32 +218,43 @@ class AlertValidator:
     def _save_cache(self):
         """Save validation cache"""
         try:
-            with open(self.validation_cache_file, 'w') as f:
-                json.dump(self.price_cache, f, indent=2, default=str)
+            with open(self.validation_cache_file, 'wb') as f:
+                f.write(_json_dumps(self.price_cache))
         except Exception as e:
             print(f"Warning: Could not save cache: {e}")
     
+    def _load_parsed_cache(self) -> Dict:
+        """Load parsed alert files from earlier runs: file name -> ((mtime_ns, size), (date_key, alerts))"""
+        if self.parsed_cache_file.exists():
+            try:
+                state = pickle.loads(self.parsed_cache_file.read_bytes())
+                if isinstance(state, dict) and state.get('version') == PARSED_CACHE_VERSION:
+                    return state['files']
+            except Exception as e:
+                print(f"Warning: Could not load parsed file cache: {e}")
+        return {}
+    
+    def _save_parsed_cache(self, state: Dict):
+        """Atomically replace the parsed alert file cache"""
+        tmp_file = self.parsed_cache_file.with_suffix('.tmp')
+        try:
+            tmp_file.write_bytes(pickle.dumps({'version': PARSED_CACHE_VERSION, 'files': state},
+                                              protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, self.parsed_cache_file)
+        except Exception as e:
+            print(f"Warning: Could not save parsed file cache: {e}")
+    
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse timestamp from various formats"""
-        try:
-            # Try ISO format first
-            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        except:
-            try:
-                # Try without timezone
-                return datetime.fromisoformat(timestamp_str)
-            except:
-                # Try other common formats
-                for fmt in ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"]:
-                    try:
-                        return datetime.strptime(timestamp_str, fmt)
-                    except:
-                        continue
-        raise ValueError(f"Could not parse timestamp: {timestamp_str}")
+        return _parse_timestamp(timestamp_str)
     
     def load_alert_data(self) -> Dict[str, List]:
         """Load all alert data files and organize by date"""
-        alert_files = sorted(list(self.momentum_data_dir.glob("alerts_*.json")))
+        alert_files = []
+        if self.momentum_data_dir.is_dir():
+            # scandir filters on the bare names without building a Path per directory entry
+            alert_files = sorted(entry.path for entry in os.scandir(self.momentum_data_dir)
+                                 if entry.name.startswith('alerts_') and entry.name.endswith('.json'))
         
         if not alert_files:
             print("No alert files found in momentum_data directory")
@@ -86,112 +263,128 @@ class AlertValidator:
         alerts_by_date = defaultdict(list)
         print(f"Found {len(alert_files)} alert files")
         
+        # Alert files are append-only history, so reuse earlier parses of unchanged files
+        parsed_cache = self._load_parsed_cache()
+        signatures = {}
+        parsed = {}
         for file_path in alert_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                timestamp = self._parse_timestamp(data['timestamp'])
-                date_key = timestamp.strftime('%Y-%m-%d')
-                
-                # Extract all tickers that appeared in any alert type
-                all_tickers = []
-                
-                # Price spikes
-                for alert in data.get('price_spikes', []):
-                    all_tickers.append({
-                        'ticker': alert['ticker'],
-                        'timestamp': timestamp,
-                        'current_price': alert['current_price'],
-                        'change_pct': alert['change_pct'],
-                        'alert_type': 'price_spike',
-                        'alert_data': alert
-                    })
-                
-                # Premarket volume alerts
-                for alert in data.get('premarket_volume_alerts', []):
-                    all_tickers.append({
-                        'ticker': alert['ticker'],
-                        'timestamp': timestamp,
-                        'current_price': alert['current_price'],
-                        'change_pct': alert.get('premarket_change', 0),
-                        'alert_type': 'premarket_volume',
-                        'alert_data': alert
-                    })
-                
-                # Premarket price alerts
-                for alert in data.get('premarket_price_alerts', []):
-                    all_tickers.append({
-                        'ticker': alert['ticker'],
-                        'timestamp': timestamp,
-                        'current_price': alert['current_price'],
-                        'change_pct': alert.get('premarket_change', 0),
-                        'alert_type': 'premarket_price',
-                        'alert_data': alert
-                    })
-                
-                alerts_by_date[date_key].extend(all_tickers)
-                
-            except Exception as e:
-                print(f"Error processing file {file_path}: {e}")
-                continue
+            stat = os.stat(file_path)
+            signatures[file_path] = (stat.st_mtime_ns, stat.st_size)
+            cached = parsed_cache.get(os.path.basename(file_path))
+            if cached is not None and cached[0] == signatures[file_path]:
+                parsed[file_path] = cached[1]
+        
+        # Each remaining file decodes independently, so spread the parsing across processes
+        to_parse = [file_path for file_path in alert_files if file_path not in parsed]
+        if to_parse:
+            # Queue readahead for every file up front so reads overlap with decoding
+            _prefetch_files(to_parse)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                parsed.update(zip(to_parse, pool.map(_parse_alert_file, to_parse, chunksize=8)))
+        
+        new_cache = {}
+        for file_path in alert_files:
+            date_key, all_tickers = parsed[file_path]
+            if date_key is not None:
+                alerts_by_date[date_key].extend(map(AlertRow._make, all_tickers))
+                new_cache[os.path.basename(file_path)] = (signatures[file_path], parsed[file_path])
+        
+        if new_cache.keys() != parsed_cache.keys() or to_parse:
+            self._save_parsed_cache(new_cache)
+        
+        # Files only give a rough order, so sort each day by alert time once here
+        for date_key in alerts_by_date:
+            alerts_by_date[date_key].sort(key=attrgetter('timestamp'))
         
         return alerts_by_date
     
     def find_first_alerts(self, alerts_by_date: Dict[str, List]) -> Dict[str, Dict]:
         """Find the first time each ticker appeared in alerts"""
-        first_alerts = {}
+        if self.alert_columns is None:
+            self._build_ticker_index(alerts_by_date)
+        
+        # Rows are sorted by (ticker, time), so each ticker's first row is its earliest alert;
+        # order those chronologically like a day-by-day scan would
+        codes = self.alert_columns['ticker_code']
+        first_rows = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if codes.size else codes
+        first_rows = first_rows[np.argsort(self.alert_columns['time'][first_rows], kind='stable')]
         
-        # Sort dates to process chronologically
-        sorted_dates = sorted(alerts_by_date.keys())
-        
-        for date in sorted_dates:
-            for alert_info in alerts_by_date[date]:
-                ticker = alert_info['ticker']
-                
-                # Only record the first time we see this ticker
-                if ticker not in first_alerts:
-                    first_alerts[ticker] = {
-                        'first_seen': alert_info['timestamp'],
-                        'date': date,
-                        'alert_price': alert_info['current_price'],
-                        'change_pct': alert_info['change_pct'],
-                        'alert_type': alert_info['alert_type'],
-                        'alert_data': alert_info['alert_data']
-                    }
+        first_alerts = {}
+        for i in first_rows:
+            alert_info = self.alert_rows[i]
+            first_alerts[alert_info.ticker] = {
+                'first_seen': alert_info.timestamp,
+                'date': self.alert_columns['date'][i],
+                'alert_price': alert_info.current_price,
+                'change_pct': alert_info.change_pct,
+                'alert_type': alert_info.alert_type,
+                'alert_data': alert_info.alert_data
+            }
         
         print(f"Found first alerts for {len(first_alerts)} unique tickers")
         return first_alerts
     
+    def _build_ticker_index(self, alerts_by_date: Dict[str, List]):
+        """Flatten alerts into columns sorted by (ticker, time) so every per-ticker lookup is a slice"""
+        dates = []
+        rows = []
+        for date_key in sorted(alerts_by_date):
+            dates.extend([date_key] * len(alerts_by_date[date_key]))
+            rows.extend(alerts_by_date[date_key])
+        
+        ticker_codes, _ = pd.factorize(np.array([row.ticker for row in rows], dtype=object))
+        times = _to_epoch_ns([row.timestamp for row in rows])
+        order = np.lexsort((times, ticker_codes))
+        
+        self.alert_rows = [rows[i] for i in order]
+        self.alert_columns = {
+            'date': np.array(dates, dtype=object)[order],
+            'ticker_code': ticker_codes[order],
+            'time': times[order],
+            'price': np.array([row.current_price for row in rows], dtype=np.float64)[order],
+            'alert_type': np.array([ALERT_TYPE_CODES[row.alert_type] for row in rows], dtype=np.int8)[order],
+        }
+        
+        # Dates follow from timestamps, so each (ticker, date) group is one contiguous run
+        self.ticker_groups = defaultdict(dict)
+        if not rows:
+            return
+        codes = self.alert_columns['ticker_code']
+        dates = self.alert_columns['date']
+        starts = np.flatnonzero(np.r_[True, (codes[1:] != codes[:-1]) | (dates[1:] != dates[:-1])])
+        ends = np.r_[starts[1:], len(rows)]
+        # Nested dicts on interned strings avoid building a tuple key for every lookup
+        for start, end in zip(starts, ends):
+            date_key = sys.intern(dates[start])
+            ticker = sys.intern(self.alert_rows[start].ticker)
+            self.ticker_groups[date_key][ticker] = slice(start, end)
+    
     def analyze_price_patterns(self, ticker: str, alert_info: Dict, alerts_by_date: Dict) -> Dict:
         """Analyze price patterns from the available alert data"""
         alert_time = alert_info['first_seen']
         date = alert_info['date']
         alert_price = alert_info['alert_price']
         
-        # Look for this ticker in subsequent alerts on the same day
-        subsequent_prices = []
+        if self.alert_columns is None:
+            self._build_ticker_index(alerts_by_date)
+        
+        # This ticker's prices on the same day, from the alert time onwards
+        group = self.ticker_groups.get(date, {}).get(ticker)
+        if group is not None:
+            times = self.alert_columns['time'][group]
+            idx = group.start + np.searchsorted(times, _to_epoch_ns([alert_time])[0], side='left')
+            subsequent_prices = self.alert_columns['price'][idx:group.stop]
+        else:
+            subsequent_prices = np.empty(0)
+        
         max_price_seen = alert_price
         max_gain = 0
-        
-        # Check all alerts for this date
-        if date in alerts_by_date:
-            for alert in alerts_by_date[date]:
-                if alert['ticker'] == ticker and alert['timestamp'] >= alert_time:
-                    price = alert['current_price']
-                    subsequent_prices.append({
-                        'time': alert['timestamp'],
-                        'price': price,
-                        'change_pct': alert['change_pct']
-                    })
-                    
-                    if price > max_price_seen:
-                        max_price_seen = price
-                        gain_pct = ((price - alert_price) / alert_price) * 100
-                        max_gain = max(max_gain, gain_pct)
+        if subsequent_prices.size:
+            max_price_seen = max(alert_price, float(subsequent_prices.max()))
+            max_gain = ((max_price_seen - alert_price) / alert_price) * 100
         
         # If no subsequent data, estimate based on the change percentage in the alert
-        if not subsequent_prices:
+        if not subsequent_prices.size:
             # Use the change percentage from the alert itself as an indicator
             initial_change = alert_info.get('change_pct', 0)
             
@@ -214,9 +407,9 @@ class AlertValidator:
             'success': success,
             'max_gain': max_gain,
             'max_price': max_price_seen,
-            'subsequent_data_points': len(subsequent_prices),
+            'subsequent_data_points': int(subsequent_prices.size),
             'alert_price': alert_price,
-            'analysis_type': 'simulated' if not subsequent_prices else 'data_based',
+            'analysis_type': 'simulated' if not subsequent_prices.size else 'data_based',
             'error': None
         }
     
@@ -232,6 +425,8 @@ class AlertValidator:
         if not alerts_by_date:
             return {'error': 'No alert data found'}
         
+        self._build_ticker_index(alerts_by_date)
+        
         print("Finding first alerts for each ticker...")
         first_alerts = self.find_first_alerts(alerts_by_date)
         
@@ -289,32 +484,36 @@ class AlertValidator:
             print(f"Error: {validation_results['error']}")
             return
         
+        # Collect the report and write it in one go rather than one print per line
+        buf = []
+        out = buf.append
+        
         summary = validation_results['summary']
         results = validation_results['results']
         
-        print("\n" + "="*80)
-        print("TELEGRAM ALERT VALIDATION RESULTS")
-        print("="*80)
+        out("\n" + "="*80)
+        out("TELEGRAM ALERT VALIDATION RESULTS")
+        out("="*80)
         
-        print(f"\nSUMMARY:")
-        print(f"Total unique tickers alerted: {summary['total_tickers']}")
-        print(f"Tickers with price data: {summary['tickers_with_data']}")
-        print(f"Successful (30%+ gain): {summary['successful_tickers']}")
-        print(f"Failed (< 30% gain): {summary['failed_tickers']}")
-        print(f"No price data available: {summary['no_data_tickers']}")
-        print(f"\nSUCCESS RATE: {summary['success_rate']:.1f}%")
+        out(f"\nSUMMARY:")
+        out(f"Total unique tickers alerted: {summary['total_tickers']}")
+        out(f"Tickers with price data: {summary['tickers_with_data']}")
+        out(f"Successful (30%+ gain): {summary['successful_tickers']}")
+        out(f"Failed (< 30% gain): {summary['failed_tickers']}")
+        out(f"No price data available: {summary['no_data_tickers']}")
+        out(f"\nSUCCESS RATE: {summary['success_rate']:.1f}%")
         
         # Show successful tickers
         if validation_results['successful_tickers']:
-            print(f"\n✅ SUCCESSFUL TICKERS ({len(validation_results['successful_tickers'])}):")
-            print("-" * 80)
+            out(f"\n✅ SUCCESSFUL TICKERS ({len(validation_results['successful_tickers'])}):")
+            out("-" * 80)
             successful_results = [(ticker, results[ticker]) for ticker in validation_results['successful_tickers']]
             successful_results.sort(key=lambda x: x[1]['max_gain'], reverse=True)
             
             for ticker, result in successful_results:
                 analysis_type = result.get('analysis_type', 'unknown')
                 data_points = result.get('subsequent_data_points', 0)
-                print(f"{ticker:6} | Alert: ${result['alert_price']:8.2f} | "
+                out(f"{ticker:6} | Alert: ${result['alert_price']:8.2f} | "
                       f"Max: ${result['max_price']:8.2f} | "
                       f"Gain: {result['max_gain']:6.1f}% | "
                       f"Date: {result['date']} | "
@@ -322,8 +521,8 @@ class AlertValidator:
         
         # Show failed tickers
         if validation_results['failed_tickers']:
-            print(f"\n❌ FAILED TICKERS ({len(validation_results['failed_tickers'])}):")
-            print("-" * 80)
+            out(f"\n❌ FAILED TICKERS ({len(validation_results['failed_tickers'])}):")
+            out("-" * 80)
             failed_results = [(ticker, results[ticker]) for ticker in validation_results['failed_tickers']]
             failed_results.sort(key=lambda x: x[1]['max_gain'] if x[1]['max_gain'] else 0, reverse=True)
             
@@ -331,29 +530,31 @@ class AlertValidator:
                 gain = result['max_gain'] if result['max_gain'] else 0
                 analysis_type = result.get('analysis_type', 'unknown')
                 data_points = result.get('subsequent_data_points', 0)
-                print(f"{ticker:6} | Alert: ${result['alert_price']:8.2f} | "
+                out(f"{ticker:6} | Alert: ${result['alert_price']:8.2f} | "
                       f"Max: ${result['max_price']:8.2f} | "
                       f"Gain: {gain:6.1f}% | "
                       f"Date: {result['date']} | "
                       f"Analysis: {analysis_type} ({data_points} data points)")
             
             if len(validation_results['failed_tickers']) > 10:
-                print(f"... and {len(validation_results['failed_tickers']) - 10} more")
+                out(f"... and {len(validation_results['failed_tickers']) - 10} more")
         
         # Show no data tickers
         if validation_results['no_data_tickers']:
-            print(f"\n⚠️  NO DATA TICKERS ({len(validation_results['no_data_tickers'])}):")
-            print("-" * 80)
+            out(f"\n⚠️  NO DATA TICKERS ({len(validation_results['no_data_tickers'])}):")
+            out("-" * 80)
             for ticker in validation_results['no_data_tickers'][:10]:
                 result = results[ticker]
-                print(f"{ticker:6} | Alert: ${result['alert_price']:8.2f} | "
+                out(f"{ticker:6} | Alert: ${result['alert_price']:8.2f} | "
                       f"Date: {result['date']} | "
                       f"Error: {result.get('error', 'Unknown')}")
             
             if len(validation_results['no_data_tickers']) > 10:
-                print(f"... and {len(validation_results['no_data_tickers']) - 10} more")
+                out(f"... and {len(validation_results['no_data_tickers']) - 10} more")
+        
+        out("\n" + "="*80)
         
-        print("\n" + "="*80)
+        sys.stdout.write('\n'.join(buf) + '\n')
 
 def main():
     parser = argparse.ArgumentParser(description='Validate telegram alerts for 30% price gains')
@@ -374,8 +575,8 @@ def main():
     
     if args.save_results and 'results' in results:
         output_file = Path(args.data_dir) / 'validation_results.json'
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(_json_dumps(results))
         print(f"\nDetailed results saved to: {output_file}")
 
 if __name__ == "__main__":
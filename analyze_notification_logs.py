@@ -4,229 +4,296 @@ Analyze telegram notification logs to optimize parameters for list_flat
 """
 
 import json
+import sys
 from datetime import datetime, timedelta
 from collections import defaultdict
-import statistics
+import heapq
+
+import numpy as np
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+def bin_counts(values, edges):
+    """Count values in each half-open [edges[i], edges[i+1]) bin in one vectorized pass"""
+    slots = np.searchsorted(edges, values, side='right')
+    return np.bincount(slots, minlength=len(edges) + 1)[1:len(edges)]
+
+def mean_change(sums, counts, key):
+    """Average of the non-zero changes accumulated for key, or 0 when there were none"""
+    n = counts.get(key, 0)
+    return sums[key] / n if n else 0
 
 def analyze_logs():
     log_file = "momentum_data/telegram_alerts_sent.jsonl"
 
+    # Collect the report and write it in one go rather than one print per line
+    buf = []
+    out = buf.append
+
+    # Decode straight from bytes; both orjson and json accept surrounding whitespace
     alerts = []
-    with open(log_file, 'r') as f:
+    append_alert = alerts.append
+    with open(log_file, 'rb') as f:
         for line in f:
+            if line.isspace():
+                continue
             try:
-                alerts.append(json.loads(line.strip()))
-            except:
+                append_alert(json_loads(line))
+            except ValueError:
                 continue
 
-    print(f"\n{'='*80}")
-    print(f"📊 NOTIFICATION LOG ANALYSIS")
-    print(f"{'='*80}")
-    print(f"\nTotal alerts logged: {len(alerts)}")
+    out(f"\n{'='*80}")
+    out(f"📊 NOTIFICATION LOG ANALYSIS")
+    out(f"{'='*80}")
+    out(f"\nTotal alerts logged: {len(alerts)}")
 
     if not alerts:
-        print("No alerts found!")
+        out("No alerts found!")
+        sys.stdout.write('\n'.join(buf) + '\n')
         return
 
-    # Date range
-    timestamps = [datetime.fromisoformat(a['timestamp']) for a in alerts]
-    print(f"Date range: {min(timestamps).strftime('%Y-%m-%d')} to {max(timestamps).strftime('%Y-%m-%d')}")
+    # Single pass over the log filling every accumulator the report needs
+    first_ts = last_ts = None
+    change_pcts = []
+    rel_vols = []
+    sector_counts = defaultdict(int)
+    sector_change_sums = defaultdict(float)
+    sector_change_counts = defaultdict(int)
+    type_counts = defaultdict(int)
+    type_change_sums = defaultdict(float)
+    type_change_counts = defaultdict(int)
+    prob_counts = defaultdict(int)
+    prob_change_sums = defaultdict(float)
+    prob_change_counts = defaultdict(int)
+    ticker_counts = defaultdict(int)
+    ticker_change_sums = defaultdict(float)
+    ticker_change_counts = defaultdict(int)
+    hour_counts = defaultdict(int)
+    hour_change_sums = defaultdict(float)
+    hour_change_counts = defaultdict(int)
+    imm_changes = []
+    immediate_count = 0
+    disregarded_count = 0
+    dis_tickers = defaultdict(int)
+
+    # Bind hot-loop callables to locals once instead of looking them up per alert
+    parse_ts = datetime.fromisoformat
+    append_change = change_pcts.append
+    append_rel_vol = rel_vols.append
+    append_imm_change = imm_changes.append
+
+    for a in alerts:
+        get = a.get
+        ts = parse_ts(a['timestamp'])
+        if first_ts is None or ts < first_ts:
+            first_ts = ts
+        if last_ts is None or ts > last_ts:
+            last_ts = ts
+
+        change = get('change_pct')
+        rel_vol = get('relative_volume')
+        sector = get('sector', 'Unknown')
+        atype = get('alert_type', 'unknown')
+        prob_cat = get('win_probability_category', 'UNKNOWN')
+        ticker = get('ticker', 'N/A')
+        hour = ts.hour
+
+        sector_counts[sector] += 1
+        type_counts[atype] += 1
+        prob_counts[prob_cat] += 1
+        ticker_counts[ticker] += 1
+        hour_counts[hour] += 1
+
+        if change:
+            append_change(change)
+            sector_change_sums[sector] += change
+            sector_change_counts[sector] += 1
+            type_change_sums[atype] += change
+            type_change_counts[atype] += 1
+            prob_change_sums[prob_cat] += change
+            prob_change_counts[prob_cat] += 1
+            ticker_change_sums[ticker] += change
+            ticker_change_counts[ticker] += 1
+            hour_change_sums[hour] += change
+            hour_change_counts[hour] += 1
+
+        if rel_vol and rel_vol > 0:
+            append_rel_vol(rel_vol)
+
+        if get('is_immediate_spike'):
+            immediate_count += 1
+            if change:
+                append_imm_change(change)
+
+        if get('disregarded'):
+            disregarded_count += 1
+            dis_tickers[ticker] += 1
+
+    # Summary statistics and percentiles work on arrays instead of re-sorting lists
+    change_arr = np.asarray(change_pcts, dtype=np.float64)
+    rel_vol_arr = np.asarray(rel_vols, dtype=np.float64)
+    change_median = float(np.median(change_arr)) if change_arr.size else 0
+    rel_vol_median = float(np.median(rel_vol_arr)) if rel_vol_arr.size else 0
+
+    out(f"Date range: {first_ts.strftime('%Y-%m-%d')} to {last_ts.strftime('%Y-%m-%d')}")
 
     # Analyze by various dimensions
-    print(f"\n{'='*80}")
-    print("📈 PRICE CHANGE ANALYSIS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("📈 PRICE CHANGE ANALYSIS")
+    out(f"{'='*80}")
 
-    change_pcts = [a.get('change_pct', 0) for a in alerts if a.get('change_pct')]
     if change_pcts:
-        print(f"  Min change: {min(change_pcts):.1f}%")
-        print(f"  Max change: {max(change_pcts):.1f}%")
-        print(f"  Mean change: {statistics.mean(change_pcts):.1f}%")
-        print(f"  Median change: {statistics.median(change_pcts):.1f}%")
+        out(f"  Min change: {change_arr.min():.1f}%")
+        out(f"  Max change: {change_arr.max():.1f}%")
+        out(f"  Mean change: {change_arr.mean():.1f}%")
+        out(f"  Median change: {change_median:.1f}%")
 
         # Distribution
-        ranges = [(0, 5), (5, 10), (10, 15), (15, 20), (20, 30), (30, 50), (50, 100), (100, 1000)]
-        print(f"\n  Change % Distribution:")
-        for low, high in ranges:
-            count = len([c for c in change_pcts if low <= c < high])
+        edges = [0, 5, 10, 15, 20, 30, 50, 100, 1000]
+        counts = bin_counts(change_arr, edges)
+        out(f"\n  Change % Distribution:")
+        for low, high, count in zip(edges[:-1], edges[1:], counts):
             pct = count / len(change_pcts) * 100
             bar = '█' * int(pct / 2)
-            print(f"    {low:3d}-{high:3d}%: {count:4d} ({pct:5.1f}%) {bar}")
+            out(f"    {low:3d}-{high:3d}%: {count:4d} ({pct:5.1f}%) {bar}")
 
-    print(f"\n{'='*80}")
-    print("📊 RELATIVE VOLUME ANALYSIS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("📊 RELATIVE VOLUME ANALYSIS")
+    out(f"{'='*80}")
 
-    rel_vols = [a.get('relative_volume', 0) for a in alerts if a.get('relative_volume') and a.get('relative_volume') > 0]
     if rel_vols:
-        print(f"  Min relative volume: {min(rel_vols):.1f}x")
-        print(f"  Max relative volume: {max(rel_vols):.1f}x")
-        print(f"  Mean relative volume: {statistics.mean(rel_vols):.1f}x")
-        print(f"  Median relative volume: {statistics.median(rel_vols):.1f}x")
+        out(f"  Min relative volume: {rel_vol_arr.min():.1f}x")
+        out(f"  Max relative volume: {rel_vol_arr.max():.1f}x")
+        out(f"  Mean relative volume: {rel_vol_arr.mean():.1f}x")
+        out(f"  Median relative volume: {rel_vol_median:.1f}x")
 
         # Distribution
-        vol_ranges = [(0, 1), (1, 2), (2, 3), (3, 5), (5, 10), (10, 20), (20, 100)]
-        print(f"\n  Relative Volume Distribution:")
-        for low, high in vol_ranges:
-            count = len([v for v in rel_vols if low <= v < high])
+        vol_edges = [0, 1, 2, 3, 5, 10, 20, 100]
+        counts = bin_counts(rel_vol_arr, vol_edges)
+        out(f"\n  Relative Volume Distribution:")
+        for low, high, count in zip(vol_edges[:-1], vol_edges[1:], counts):
             pct = count / len(rel_vols) * 100
             bar = '█' * int(pct / 2)
-            print(f"    {low:3d}-{high:3d}x: {count:4d} ({pct:5.1f}%) {bar}")
+            out(f"    {low:3d}-{high:3d}x: {count:4d} ({pct:5.1f}%) {bar}")
 
-    print(f"\n{'='*80}")
-    print("🏷️ SECTOR ANALYSIS")
-    print(f"{'='*80}")
-
-    sectors = defaultdict(list)
-    for a in alerts:
-        sector = a.get('sector', 'Unknown')
-        sectors[sector].append(a)
+    out(f"\n{'='*80}")
+    out("🏷️ SECTOR ANALYSIS")
+    out(f"{'='*80}")
 
-    print(f"\n  Alerts by Sector:")
+    out(f"\n  Alerts by Sector:")
     sector_stats = []
-    for sector, sector_alerts in sorted(sectors.items(), key=lambda x: -len(x[1])):
-        changes = [a.get('change_pct', 0) for a in sector_alerts if a.get('change_pct')]
-        avg_change = statistics.mean(changes) if changes else 0
-        sector_stats.append((sector, len(sector_alerts), avg_change))
+    for sector, count in sorted(sector_counts.items(), key=lambda x: -x[1]):
+        avg_change = mean_change(sector_change_sums, sector_change_counts, sector)
+        sector_stats.append((sector, count, avg_change))
 
     for sector, count, avg_change in sector_stats[:15]:
         pct = count / len(alerts) * 100
-        print(f"    {sector[:30]:30s}: {count:4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
+        out(f"    {sector[:30]:30s}: {count:4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
 
-    print(f"\n{'='*80}")
-    print("🔔 ALERT TYPE ANALYSIS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("🔔 ALERT TYPE ANALYSIS")
+    out(f"{'='*80}")
 
-    alert_types = defaultdict(list)
-    for a in alerts:
-        atype = a.get('alert_type', 'unknown')
-        alert_types[atype].append(a)
-
-    print(f"\n  Alerts by Type:")
-    for atype, type_alerts in sorted(alert_types.items(), key=lambda x: -len(x[1])):
-        changes = [a.get('change_pct', 0) for a in type_alerts if a.get('change_pct')]
-        avg_change = statistics.mean(changes) if changes else 0
-        pct = len(type_alerts) / len(alerts) * 100
-        print(f"    {atype:25s}: {len(type_alerts):4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
+    out(f"\n  Alerts by Type:")
+    for atype, count in sorted(type_counts.items(), key=lambda x: -x[1]):
+        avg_change = mean_change(type_change_sums, type_change_counts, atype)
+        pct = count / len(alerts) * 100
+        out(f"    {atype:25s}: {count:4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
 
-    print(f"\n{'='*80}")
-    print("⚡ IMMEDIATE SPIKE ANALYSIS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("⚡ IMMEDIATE SPIKE ANALYSIS")
+    out(f"{'='*80}")
 
-    immediate = [a for a in alerts if a.get('is_immediate_spike')]
-    regular = [a for a in alerts if not a.get('is_immediate_spike')]
+    regular_count = len(alerts) - immediate_count
 
-    print(f"\n  Immediate spikes: {len(immediate)} ({len(immediate)/len(alerts)*100:.1f}%)")
-    print(f"  Regular alerts: {len(regular)} ({len(regular)/len(alerts)*100:.1f}%)")
+    out(f"\n  Immediate spikes: {immediate_count} ({immediate_count/len(alerts)*100:.1f}%)")
+    out(f"  Regular alerts: {regular_count} ({regular_count/len(alerts)*100:.1f}%)")
 
-    if immediate:
-        imm_changes = [a.get('change_pct', 0) for a in immediate if a.get('change_pct')]
+    if immediate_count:
         if imm_changes:
-            print(f"\n  Immediate spike stats:")
-            print(f"    Min change: {min(imm_changes):.1f}%")
-            print(f"    Max change: {max(imm_changes):.1f}%")
-            print(f"    Avg change: {statistics.mean(imm_changes):.1f}%")
+            out(f"\n  Immediate spike stats:")
+            out(f"    Min change: {min(imm_changes):.1f}%")
+            out(f"    Max change: {max(imm_changes):.1f}%")
+            out(f"    Avg change: {sum(imm_changes) / len(imm_changes):.1f}%")
+
+    out(f"\n{'='*80}")
+    out("📈 WIN PROBABILITY ANALYSIS")
+    out(f"{'='*80}")
+
+    out(f"\n  Alerts by Win Probability Category:")
+    for cat, count in sorted(prob_counts.items(), key=lambda x: -x[1]):
+        avg_change = mean_change(prob_change_sums, prob_change_counts, cat)
+        pct = count / len(alerts) * 100
+        out(f"    {cat:15s}: {count:4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
 
-    print(f"\n{'='*80}")
-    print("📈 WIN PROBABILITY ANALYSIS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("🚫 DISREGARDED ALERTS")
+    out(f"{'='*80}")
 
-    probabilities = defaultdict(list)
-    for a in alerts:
-        prob_cat = a.get('win_probability_category', 'UNKNOWN')
-        probabilities[prob_cat].append(a)
-
-    print(f"\n  Alerts by Win Probability Category:")
-    for cat, cat_alerts in sorted(probabilities.items(), key=lambda x: -len(x[1])):
-        changes = [a.get('change_pct', 0) for a in cat_alerts if a.get('change_pct')]
-        avg_change = statistics.mean(changes) if changes else 0
-        pct = len(cat_alerts) / len(alerts) * 100
-        print(f"    {cat:15s}: {len(cat_alerts):4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
-
-    print(f"\n{'='*80}")
-    print("🚫 DISREGARDED ALERTS")
-    print(f"{'='*80}")
-
-    disregarded = [a for a in alerts if a.get('disregarded')]
-    print(f"\n  Disregarded alerts: {len(disregarded)} ({len(disregarded)/len(alerts)*100:.1f}%)")
-
-    if disregarded:
-        dis_tickers = defaultdict(int)
-        for a in disregarded:
-            dis_tickers[a.get('ticker', 'N/A')] += 1
-        print(f"\n  Top disregarded tickers:")
-        for ticker, count in sorted(dis_tickers.items(), key=lambda x: -x[1])[:10]:
-            print(f"    {ticker}: {count}")
-
-    print(f"\n{'='*80}")
-    print("📊 TOP TICKERS BY FREQUENCY")
-    print(f"{'='*80}")
-
-    tickers = defaultdict(list)
-    for a in alerts:
-        tickers[a.get('ticker', 'N/A')].append(a)
+    out(f"\n  Disregarded alerts: {disregarded_count} ({disregarded_count/len(alerts)*100:.1f}%)")
+
+    if disregarded_count:
+        out(f"\n  Top disregarded tickers:")
+        for ticker, count in heapq.nlargest(10, dis_tickers.items(), key=lambda x: x[1]):
+            out(f"    {ticker}: {count}")
 
-    print(f"\n  Top 20 Most Alerted Tickers:")
-    ticker_stats = []
-    for ticker, ticker_alerts in tickers.items():
-        changes = [a.get('change_pct', 0) for a in ticker_alerts if a.get('change_pct')]
-        avg_change = statistics.mean(changes) if changes else 0
-        ticker_stats.append((ticker, len(ticker_alerts), avg_change))
+    out(f"\n{'='*80}")
+    out("📊 TOP TICKERS BY FREQUENCY")
+    out(f"{'='*80}")
 
-    ticker_stats.sort(key=lambda x: -x[1])
-    for ticker, count, avg_change in ticker_stats[:20]:
+    out(f"\n  Top 20 Most Alerted Tickers:")
+    for ticker, count in heapq.nlargest(20, ticker_counts.items(), key=lambda x: x[1]):
+        avg_change = mean_change(ticker_change_sums, ticker_change_counts, ticker)
         pct = count / len(alerts) * 100
-        print(f"    {ticker:6s}: {count:4d} alerts ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
+        out(f"    {ticker:6s}: {count:4d} alerts ({pct:5.1f}%) avg_chg={avg_change:+.1f}%")
 
-    print(f"\n{'='*80}")
-    print("⏰ TIME OF DAY ANALYSIS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("⏰ TIME OF DAY ANALYSIS")
+    out(f"{'='*80}")
 
-    hours = defaultdict(list)
-    for a in alerts:
-        try:
-            ts = datetime.fromisoformat(a['timestamp'])
-            hours[ts.hour].append(a)
-        except:
-            pass
-
-    print(f"\n  Alerts by Hour (EST):")
-    for hour in sorted(hours.keys()):
-        hour_alerts = hours[hour]
-        changes = [a.get('change_pct', 0) for a in hour_alerts if a.get('change_pct')]
-        avg_change = statistics.mean(changes) if changes else 0
-        pct = len(hour_alerts) / len(alerts) * 100
+    out(f"\n  Alerts by Hour (EST):")
+    for hour in sorted(hour_counts.keys()):
+        count = hour_counts[hour]
+        avg_change = mean_change(hour_change_sums, hour_change_counts, hour)
+        pct = count / len(alerts) * 100
         bar = '█' * int(pct)
-        print(f"    {hour:02d}:00 - {len(hour_alerts):4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}% {bar}")
+        out(f"    {hour:02d}:00 - {count:4d} ({pct:5.1f}%) avg_chg={avg_change:+.1f}% {bar}")
 
-    print(f"\n{'='*80}")
-    print("💡 OPTIMIZATION RECOMMENDATIONS")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("💡 OPTIMIZATION RECOMMENDATIONS")
+    out(f"{'='*80}")
 
     # Calculate optimal thresholds based on data
-    print(f"\n  Based on the analysis:")
+    out(f"\n  Based on the analysis:")
 
     # 1. Volume ratio recommendations
     if rel_vols:
-        p25 = sorted(rel_vols)[len(rel_vols)//4]
-        p50 = statistics.median(rel_vols)
-        p75 = sorted(rel_vols)[3*len(rel_vols)//4]
-        print(f"\n  📊 VOLUME RATIO:")
-        print(f"    Current: 1x minimum")
-        print(f"    25th percentile: {p25:.1f}x")
-        print(f"    50th percentile: {p50:.1f}x")
-        print(f"    75th percentile: {p75:.1f}x")
+        k25, k75 = rel_vol_arr.size // 4, 3 * rel_vol_arr.size // 4
+        ranked = np.partition(rel_vol_arr, [k25, k75])
+        p25 = ranked[k25]
+        p50 = rel_vol_median
+        p75 = ranked[k75]
+        out(f"\n  📊 VOLUME RATIO:")
+        out(f"    Current: 1x minimum")
+        out(f"    25th percentile: {p25:.1f}x")
+        out(f"    50th percentile: {p50:.1f}x")
+        out(f"    75th percentile: {p75:.1f}x")
         if p25 > 1.5:
-            print(f"    ⚡ RECOMMENDATION: Increase minimum to {max(1.5, p25-0.5):.1f}x to filter noise")
+            out(f"    ⚡ RECOMMENDATION: Increase minimum to {max(1.5, p25-0.5):.1f}x to filter noise")
 
     # 2. Price change recommendations
     if change_pcts:
-        p25 = sorted(change_pcts)[len(change_pcts)//4]
-        p50 = statistics.median(change_pcts)
-        print(f"\n  📈 PRICE CHANGE:")
-        print(f"    25th percentile: {p25:.1f}%")
-        print(f"    50th percentile: {p50:.1f}%")
-        print(f"    ⚡ RECOMMENDATION: Consider focusing on {p25:.0f}%+ moves for better signal quality")
+        k25 = change_arr.size // 4
+        p25 = np.partition(change_arr, k25)[k25]
+        p50 = change_median
+        out(f"\n  📈 PRICE CHANGE:")
+        out(f"    25th percentile: {p25:.1f}%")
+        out(f"    50th percentile: {p50:.1f}%")
+        out(f"    ⚡ RECOMMENDATION: Consider focusing on {p25:.0f}%+ moves for better signal quality")
 
     # 3. Sector recommendations
     high_noise_sectors = []
@@ -235,60 +302,61 @@ def analyze_logs():
             high_noise_sectors.append(sector)
 
     if high_noise_sectors:
-        print(f"\n  🏷️ SECTOR FILTERING:")
-        print(f"    High-noise sectors (consider higher thresholds):")
+        out(f"\n  🏷️ SECTOR FILTERING:")
+        out(f"    High-noise sectors (consider higher thresholds):")
         for sector in high_noise_sectors[:5]:
-            print(f"      - {sector}")
+            out(f"      - {sector}")
 
     # 4. Time recommendations
-    print(f"\n  ⏰ TIME-BASED:")
-    peak_hours = sorted(hours.keys(), key=lambda h: len(hours[h]), reverse=True)[:3]
-    print(f"    Peak activity hours: {', '.join([f'{h:02d}:00' for h in peak_hours])}")
+    out(f"\n  ⏰ TIME-BASED:")
+    peak_hours = heapq.nlargest(3, hour_counts.keys(), key=lambda h: hour_counts[h])
+    out(f"    Peak activity hours: {', '.join([f'{h:02d}:00' for h in peak_hours])}")
 
     # 5. Alert type recommendations
-    print(f"\n  🔔 ALERT TYPE QUALITY:")
+    out(f"\n  🔔 ALERT TYPE QUALITY:")
     best_types = []
-    for atype, type_alerts in alert_types.items():
-        if len(type_alerts) >= 10:
-            changes = [a.get('change_pct', 0) for a in type_alerts if a.get('change_pct')]
-            if changes:
-                avg = statistics.mean(changes)
-                best_types.append((atype, avg, len(type_alerts)))
+    for atype, count in type_counts.items():
+        if count >= 10:
+            if type_change_counts.get(atype):
+                avg = mean_change(type_change_sums, type_change_counts, atype)
+                best_types.append((atype, avg, count))
 
     best_types.sort(key=lambda x: -x[1])
-    print(f"    Best performing alert types:")
+    out(f"    Best performing alert types:")
     for atype, avg_change, count in best_types[:5]:
-        print(f"      - {atype}: avg {avg_change:+.1f}% ({count} alerts)")
+        out(f"      - {atype}: avg {avg_change:+.1f}% ({count} alerts)")
 
-    print(f"\n{'='*80}")
-    print("📋 SPECIFIC PARAMETER SUGGESTIONS FOR LIST_FLAT")
-    print(f"{'='*80}")
+    out(f"\n{'='*80}")
+    out("📋 SPECIFIC PARAMETER SUGGESTIONS FOR LIST_FLAT")
+    out(f"{'='*80}")
 
     # Analyze for list_flat specific optimizations
-    print(f"\n  Current list_flat settings:")
-    print(f"    - Volume ratio minimum: 1x")
-    print(f"    - Max results: 20")
-    print(f"    - Sort: by intraday movement")
+    out(f"\n  Current list_flat settings:")
+    out(f"    - Volume ratio minimum: 1x")
+    out(f"    - Max results: 20")
+    out(f"    - Sort: by intraday movement")
 
-    print(f"\n  Suggested optimizations:")
+    out(f"\n  Suggested optimizations:")
 
     # Based on volume data
-    if rel_vols and statistics.median(rel_vols) > 2:
-        print(f"    1. VOLUME RATIO: Increase minimum from 1x to 1.5x")
-        print(f"       (Current median is {statistics.median(rel_vols):.1f}x)")
+    if rel_vols and rel_vol_median > 2:
+        out(f"    1. VOLUME RATIO: Increase minimum from 1x to 1.5x")
+        out(f"       (Current median is {rel_vol_median:.1f}x)")
 
     # Based on the noise level
-    print(f"    2. TOP RESULTS: Consider reducing from 20 to 15")
-    print(f"       (Focus on higher quality signals)")
+    out(f"    2. TOP RESULTS: Consider reducing from 20 to 15")
+    out(f"       (Focus on higher quality signals)")
 
     # Based on price movements
     if change_pcts:
-        low_movers = len([c for c in change_pcts if c < 5])
+        low_movers = int((change_arr < 5).sum())
         if low_movers > len(change_pcts) * 0.3:
-            print(f"    3. INTRADAY MOVEMENT: Add minimum threshold of 2%")
-            print(f"       ({low_movers} alerts ({low_movers/len(change_pcts)*100:.0f}%) were <5%)")
+            out(f"    3. INTRADAY MOVEMENT: Add minimum threshold of 2%")
+            out(f"       ({low_movers} alerts ({low_movers/len(change_pcts)*100:.0f}%) were <5%)")
+
+    out(f"\n")
 
-    print(f"\n")
+    sys.stdout.write('\n'.join(buf) + '\n')
 
 if __name__ == "__main__":
     analyze_logs()
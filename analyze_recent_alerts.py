@@ -4,41 +4,151 @@ Analyze recent alerts from the last 2 weeks to determine optimal ranges
 """
 
 import json
-import yfinance as yf
-from datetime import datetime, timedelta
 from collections import defaultdict
-import statistics
+from datetime import datetime, timedelta
 
-def get_price_performance(ticker, alert_date, alert_price):
-    """Get the price performance after an alert"""
-    try:
-        # Get data for 5 days after alert
-        end_date = alert_date + timedelta(days=5)
-        data = yf.download(ticker, start=alert_date, end=end_date, progress=False, interval='1d')
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from data_utils import PriceCache
 
-        if data.empty:
-            return None, None
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-        # Get high price in the 5 days after alert
-        max_price = data['High'].max()
-        max_gain_pct = ((max_price - alert_price) / alert_price) * 100
+# Bucket edges for the range breakdowns; np.histogram closes the last bucket, which matches "Over X"
+PRICE_BINS = np.array([-np.inf, 1, 3, 6, 10, np.inf])
+VOLUME_BINS = np.array([-np.inf, 10, 50, 200, 500, np.inf])
+CHANGE_BINS = np.array([-np.inf, 15, 30, 50, 100, np.inf])
 
-        return max_price, max_gain_pct
+# Yahoo handles multi-symbol requests fine up to about this many tickers
+DOWNLOAD_BATCH_SIZE = 20
+# Worker threads yf.download uses to fetch a batch's tickers concurrently
+DOWNLOAD_THREADS = 8
+
+# Each ticker's 5-day alert window, as downloaded here
+PRICE_CACHE = PriceCache('analyze_recent_alerts')
+
+def download_batch(tickers, start, end):
+    """Download daily bars for a batch of tickers in one request, returning {ticker: DataFrame}"""
+    try:
+        data = yf.download(tickers, start=start, end=end, group_by='ticker', threads=DOWNLOAD_THREADS,
+                           progress=False, interval='1d')
     except Exception as e:
+        return {}
+
+    if data.empty:
+        return {}
+
+    frames = {}
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            frame = data[ticker]
+        else:
+            frame = data
+        frames[ticker] = frame.dropna(how='all')
+    return frames
+
+def alert_window(data, alert_date):
+    """A ticker's daily bars for the 5 days after an alert"""
+    end_date = alert_date + timedelta(days=5)
+    bar_dates = data.index.date
+    return data[(bar_dates >= alert_date) & (bar_dates < end_date)]
+
+def download_price_history(alert_dates):
+    """Daily bars covering each ticker's 5-day alert window, read from the disk cache where possible
+    and otherwise downloaded in symbol batches"""
+    history = {}
+    for ticker, alert_date in alert_dates.items():
+        cached = PRICE_CACHE.load(ticker, alert_date, alert_date + timedelta(days=5), '1d')
+        if cached is not None:
+            history[ticker] = cached
+
+    tickers = [ticker for ticker in alert_dates if ticker not in history]
+    if not tickers:
+        return history
+
+    # One download window spanning every uncached alert's 5 days
+    start = min(alert_dates[ticker] for ticker in tickers)
+    end = max(alert_dates[ticker] for ticker in tickers) + timedelta(days=5)
+    # Batches run one after another: yf.download collects results in module-level state, so concurrent calls
+    # would mix them. The concurrency comes from its own threads within each batch.
+    for batch_start in range(0, len(tickers), DOWNLOAD_BATCH_SIZE):
+        batch = tickers[batch_start:batch_start + DOWNLOAD_BATCH_SIZE]
+        for ticker, data in download_batch(batch, start, end).items():
+            alert_date = alert_dates[ticker]
+            history[ticker] = alert_window(data, alert_date)
+            # A failed ticker comes back as an empty frame; caching it would report no data for good
+            if not history[ticker].empty:
+                PRICE_CACHE.store(ticker, alert_date, alert_date + timedelta(days=5), '1d', history[ticker])
+    return history
+
+def get_price_performance(data, alert_date, alert_price):
+    """Get the price performance in the 5 days after an alert from pre-downloaded daily bars"""
+    if data is None:
         return None, None
 
+    window = alert_window(data, alert_date)
+
+    # Highs as a plain array, so the max is a float whether 'High' comes back as a Series or a one-column frame
+    highs = window['High'].to_numpy(dtype=np.float64)
+    if np.isnan(highs).all():
+        return None, None
+
+    # Get high price in the 5 days after alert
+    max_price = float(np.nanmax(highs))
+    max_gain_pct = ((max_price - alert_price) / alert_price) * 100
+
+    return max_price, max_gain_pct
+
+def summarize_cohort(cohort):
+    """Collect prices, volumes, changes, sectors, alert types and scores for a cohort in one pass"""
+    n = len(cohort)
+    prices = np.empty(n)
+    volumes = np.empty(n)
+    changes = np.empty(n)
+    sectors = defaultdict(int)
+    types = defaultdict(int)
+    scores = []
+    for i, alert in enumerate(cohort):
+        prices[i] = alert['alert_price']
+        volumes[i] = alert.get('relative_volume') or np.nan
+        changes[i] = alert['change_pct']
+        sectors[alert.get('sector', 'Unknown')] += 1
+        for atype in alert.get('alert_types', []):
+            types[atype] += 1
+        if alert.get('pattern_score'):
+            scores.append(alert['pattern_score'])
+    return {
+        'prices': prices,
+        # Bucketed once here; the range breakdown and the recommendations both read these counts
+        'price_counts': np.histogram(prices, bins=PRICE_BINS)[0],
+        'volumes': volumes[~np.isnan(volumes)],
+        'changes': changes,
+        'sectors': sectors,
+        'types': types,
+        'scores': scores,
+    }
+
 # Load alerts from last 2 weeks
 two_weeks_ago = datetime.now() - timedelta(days=14)
+two_weeks_ago_ts = two_weeks_ago.timestamp()
 alerts = []
 
-with open('momentum_data/telegram_alerts_sent.jsonl', 'r') as f:
+# Stream the log line by line rather than slurping it; it only ever grows
+with open('momentum_data/telegram_alerts_sent.jsonl', 'rb') as f:
     for line in f:
         if line.strip():
-            alert = json.loads(line)
-            alert_time = datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00'))
+            alert = json_loads(line)
+            alert_ts = datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00')).timestamp()
 
             # Only include alerts from last 2 weeks
-            if alert_time.replace(tzinfo=None) >= two_weeks_ago:
+            if alert_ts >= two_weeks_ago_ts:
                 alerts.append(alert)
 
 print(f"📊 ANALYZING {len(alerts)} ALERTS FROM LAST 2 WEEKS")
@@ -59,29 +169,30 @@ winners = []
 losers = []
 no_data = []
 
+alert_dates = {ticker: datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00')).date()
+               for ticker, alert in unique_tickers.items()}
+
+# One batched download covering every alert's 5-day window instead of a request per ticker
+price_history = {}
+if alert_dates:
+    print(f"🔍 Downloading price data for {len(alert_dates)} tickers...")
+    price_history = download_price_history(alert_dates)
+
 print("🔍 Checking price performance for each ticker...")
 for i, (ticker, alert) in enumerate(unique_tickers.items(), 1):
     if i % 10 == 0:
         print(f"   Processed {i}/{len(unique_tickers)} tickers...")
 
-    alert_date = datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00')).date()
+    alert_date = alert_dates[ticker]
     alert_price = alert['alert_price']
 
-    max_price, max_gain = get_price_performance(ticker, alert_date, alert_price)
+    max_price, max_gain = get_price_performance(price_history.get(ticker), alert_date, alert_price)
 
     if max_gain is not None:
-        # Convert Series to float if needed
-        if hasattr(max_gain, 'iloc'):
-            max_gain_value = float(max_gain.iloc[0])
-            max_price_value = float(max_price.iloc[0]) if hasattr(max_price, 'iloc') else float(max_price)
-        else:
-            max_gain_value = float(max_gain)
-            max_price_value = float(max_price)
+        alert['max_gain'] = max_gain
+        alert['max_price'] = max_price
 
-        alert['max_gain'] = max_gain_value
-        alert['max_price'] = max_price_value
-
-        if max_gain_value >= 30:
+        if max_gain >= 30:
             winners.append(alert)
         else:
             losers.append(alert)
@@ -104,65 +215,64 @@ print()
 if winners:
     print("🏆 WINNING PATTERN ANALYSIS")
     print("=" * 70)
+    winner_stats = summarize_cohort(winners)
 
     # Price ranges
-    winner_prices = [w['alert_price'] for w in winners]
+    winner_prices = winner_stats['prices']
+    price_counts = winner_stats['price_counts']
     print(f"💰 PRICE RANGES:")
-    print(f"   Under $1: {len([p for p in winner_prices if p < 1])}")
-    print(f"   $1-3: {len([p for p in winner_prices if 1 <= p < 3])}")
-    print(f"   $3-6: {len([p for p in winner_prices if 3 <= p < 6])}")
-    print(f"   $6-10: {len([p for p in winner_prices if 6 <= p < 10])}")
-    print(f"   Over $10: {len([p for p in winner_prices if p >= 10])}")
-    print(f"   Avg: ${statistics.mean(winner_prices):.2f}, Median: ${statistics.median(winner_prices):.2f}")
+    print(f"   Under $1: {price_counts[0]}")
+    print(f"   $1-3: {price_counts[1]}")
+    print(f"   $3-6: {price_counts[2]}")
+    print(f"   $6-10: {price_counts[3]}")
+    print(f"   Over $10: {price_counts[4]}")
+    print(f"   Avg: ${winner_prices.mean():.2f}, Median: ${np.median(winner_prices):.2f}")
     print()
 
     # Volume ranges
-    winner_volumes = [w['relative_volume'] for w in winners if w.get('relative_volume')]
-    if winner_volumes:
+    winner_volumes = winner_stats['volumes']
+    if winner_volumes.size:
+        volume_counts, _ = np.histogram(winner_volumes, bins=VOLUME_BINS)
         print(f"📊 RELATIVE VOLUME RANGES:")
-        print(f"   Under 10x: {len([v for v in winner_volumes if v < 10])}")
-        print(f"   10-50x: {len([v for v in winner_volumes if 10 <= v < 50])}")
-        print(f"   50-200x: {len([v for v in winner_volumes if 50 <= v < 200])}")
-        print(f"   200-500x: {len([v for v in winner_volumes if 200 <= v < 500])}")
-        print(f"   Over 500x: {len([v for v in winner_volumes if v >= 500])}")
-        print(f"   Avg: {statistics.mean(winner_volumes):.1f}x, Median: {statistics.median(winner_volumes):.1f}x")
+        print(f"   Under 10x: {volume_counts[0]}")
+        print(f"   10-50x: {volume_counts[1]}")
+        print(f"   50-200x: {volume_counts[2]}")
+        print(f"   200-500x: {volume_counts[3]}")
+        print(f"   Over 500x: {volume_counts[4]}")
+        print(f"   Avg: {winner_volumes.mean():.1f}x, Median: {np.median(winner_volumes):.1f}x")
         print()
 
     # Change percentage ranges
-    winner_changes = [w['change_pct'] for w in winners]
+    winner_changes = winner_stats['changes']
+    change_counts, _ = np.histogram(winner_changes, bins=CHANGE_BINS)
     print(f"⚡ INITIAL CHANGE % RANGES:")
-    print(f"   Under 15%: {len([c for c in winner_changes if c < 15])}")
-    print(f"   15-30%: {len([c for c in winner_changes if 15 <= c < 30])}")
-    print(f"   30-50%: {len([c for c in winner_changes if 30 <= c < 50])}")
-    print(f"   50-100%: {len([c for c in winner_changes if 50 <= c < 100])}")
-    print(f"   Over 100%: {len([c for c in winner_changes if c >= 100])}")
-    print(f"   Avg: {statistics.mean(winner_changes):.1f}%, Median: {statistics.median(winner_changes):.1f}%")
+    print(f"   Under 15%: {change_counts[0]}")
+    print(f"   15-30%: {change_counts[1]}")
+    print(f"   30-50%: {change_counts[2]}")
+    print(f"   50-100%: {change_counts[3]}")
+    print(f"   Over 100%: {change_counts[4]}")
+    print(f"   Avg: {winner_changes.mean():.1f}%, Median: {np.median(winner_changes):.1f}%")
     print()
 
     # Sectors
-    winner_sectors = defaultdict(int)
-    for w in winners:
-        winner_sectors[w.get('sector', 'Unknown')] += 1
+    winner_sectors = winner_stats['sectors']
     print(f"🏭 TOP WINNING SECTORS:")
     for sector, count in sorted(winner_sectors.items(), key=lambda x: x[1], reverse=True)[:10]:
         print(f"   {sector}: {count}")
     print()
 
     # Alert types
-    winner_types = defaultdict(int)
-    for w in winners:
-        for atype in w.get('alert_types', []):
-            winner_types[atype] += 1
+    winner_types = winner_stats['types']
     print(f"📈 WINNING ALERT TYPES:")
     for atype, count in sorted(winner_types.items(), key=lambda x: x[1], reverse=True):
         print(f"   {atype}: {count}")
     print()
 
     # Pattern scores
-    winner_scores = [w.get('pattern_score', 0) for w in winners if w.get('pattern_score')]
+    winner_scores = winner_stats['scores']
     if winner_scores:
         print(f"🎯 PATTERN SCORES:")
-        print(f"   Avg: {statistics.mean(winner_scores):.1f}, Median: {statistics.median(winner_scores):.1f}")
+        print(f"   Avg: {np.mean(winner_scores):.1f}, Median: {np.median(winner_scores):.1f}")
         print(f"   Min: {min(winner_scores)}, Max: {max(winner_scores)}")
         print()
 
@@ -170,28 +280,31 @@ if winners:
 if losers:
     print("❌ LOSING PATTERN ANALYSIS (for comparison)")
     print("=" * 70)
+    loser_stats = summarize_cohort(losers)
 
     # Price ranges
-    loser_prices = [l['alert_price'] for l in losers]
+    loser_prices = loser_stats['prices']
+    price_counts = loser_stats['price_counts']
     print(f"💰 PRICE RANGES:")
-    print(f"   Under $1: {len([p for p in loser_prices if p < 1])}")
-    print(f"   $1-3: {len([p for p in loser_prices if 1 <= p < 3])}")
-    print(f"   $3-6: {len([p for p in loser_prices if 3 <= p < 6])}")
-    print(f"   $6-10: {len([p for p in loser_prices if 6 <= p < 10])}")
-    print(f"   Over $10: {len([p for p in loser_prices if p >= 10])}")
-    print(f"   Avg: ${statistics.mean(loser_prices):.2f}, Median: ${statistics.median(loser_prices):.2f}")
+    print(f"   Under $1: {price_counts[0]}")
+    print(f"   $1-3: {price_counts[1]}")
+    print(f"   $3-6: {price_counts[2]}")
+    print(f"   $6-10: {price_counts[3]}")
+    print(f"   Over $10: {price_counts[4]}")
+    print(f"   Avg: ${loser_prices.mean():.2f}, Median: ${np.median(loser_prices):.2f}")
     print()
 
     # Volume ranges
-    loser_volumes = [l['relative_volume'] for l in losers if l.get('relative_volume')]
-    if loser_volumes:
+    loser_volumes = loser_stats['volumes']
+    if loser_volumes.size:
+        volume_counts, _ = np.histogram(loser_volumes, bins=VOLUME_BINS)
         print(f"📊 RELATIVE VOLUME RANGES:")
-        print(f"   Under 10x: {len([v for v in loser_volumes if v < 10])}")
-        print(f"   10-50x: {len([v for v in loser_volumes if 10 <= v < 50])}")
-        print(f"   50-200x: {len([v for v in loser_volumes if 50 <= v < 200])}")
-        print(f"   200-500x: {len([v for v in loser_volumes if 200 <= v < 500])}")
-        print(f"   Over 500x: {len([v for v in loser_volumes if v >= 500])}")
-        print(f"   Avg: {statistics.mean(loser_volumes):.1f}x, Median: {statistics.median(loser_volumes):.1f}x")
+        print(f"   Under 10x: {volume_counts[0]}")
+        print(f"   10-50x: {volume_counts[1]}")
+        print(f"   50-200x: {volume_counts[2]}")
+        print(f"   200-500x: {volume_counts[3]}")
+        print(f"   Over 500x: {volume_counts[4]}")
+        print(f"   Avg: {loser_volumes.mean():.1f}x, Median: {np.median(loser_volumes):.1f}x")
         print()
 
 print("=" * 70)
@@ -199,15 +312,12 @@ print("💡 RECOMMENDATIONS FOR volume_momentum_tracker.py")
 print("=" * 70)
 
 if winners and losers:
-    winner_prices = [w['alert_price'] for w in winners]
-    loser_prices = [l['alert_price'] for l in losers]
-
-    # Price sweet spot
-    winner_1_3 = len([p for p in winner_prices if 1 <= p < 3])
-    total_1_3 = len([p for p in winner_prices if 1 <= p < 3]) + len([p for p in loser_prices if 1 <= p < 3])
+    # Price sweet spot, from the per-bucket counts ($1-3 and $3-6 are buckets 1 and 2)
+    winner_counts = winner_stats['price_counts']
+    total_counts = winner_counts + loser_stats['price_counts']
 
-    winner_3_6 = len([p for p in winner_prices if 3 <= p < 6])
-    total_3_6 = len([p for p in winner_prices if 3 <= p < 6]) + len([p for p in loser_prices if 3 <= p < 6])
+    winner_1_3, total_1_3 = int(winner_counts[1]), int(total_counts[1])
+    winner_3_6, total_3_6 = int(winner_counts[2]), int(total_counts[2])
 
     if total_1_3 > 0:
         success_1_3 = (winner_1_3 / total_1_3) * 100
@@ -218,13 +328,13 @@ if winners and losers:
         print(f"📊 $3-6 range: {success_3_6:.1f}% success rate ({winner_3_6}/{total_3_6})")
 
     # Volume analysis
-    winner_volumes = [w['relative_volume'] for w in winners if w.get('relative_volume')]
-    loser_volumes = [l['relative_volume'] for l in losers if l.get('relative_volume')]
+    winner_volumes = winner_stats['volumes']
+    loser_volumes = loser_stats['volumes']
 
-    if winner_volumes:
-        print(f"📊 Winning alerts avg volume: {statistics.mean(winner_volumes):.1f}x")
-    if loser_volumes:
-        print(f"📊 Losing alerts avg volume: {statistics.mean(loser_volumes):.1f}x")
+    if winner_volumes.size:
+        print(f"📊 Winning alerts avg volume: {winner_volumes.mean():.1f}x")
+    if loser_volumes.size:
+        print(f"📊 Losing alerts avg volume: {loser_volumes.mean():.1f}x")
 
 print()
 print("✅ Analysis complete!")
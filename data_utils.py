@@ -0,0 +1,96 @@
+"""
+Helpers shared by the alert analysis scripts:
+- PriceCache: on-disk cache of downloaded price bars
+- seek_log_date: jump to a date in the append-only Telegram alert log
+"""
+
+import os
+import pickle
+import re
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# Downloaded bars are cached on disk, one pickle per script, ticker, date window and interval
+PRICE_CACHE_DIR = Path('momentum_data') / 'price_cache'
+# Cached bars written before the window's last session ended may still be filling in, so they are refetched after this long
+PRICE_CACHE_MAX_AGE = timedelta(hours=1)
+# End of after-hours trading (ET), after which a session's bars stop changing
+SESSION_END_HOUR = 20
+
+# Date of a Telegram log line, read straight from the raw bytes
+TIMESTAMP_DATE_RE = re.compile(rb'"timestamp":\s*"(\d{4}-\d{2}-\d{2})')
+
+
+def _log_line_date(log, start):
+    """Timestamp date (bytes) of the first line at or after `start` that has one, or None"""
+    while start < len(log):
+        end = log.find(b'\n', start)
+        if end == -1:
+            end = len(log)
+        match = TIMESTAMP_DATE_RE.search(log, start, end)
+        if match:
+            return match.group(1)
+        start = end + 1
+    return None
+
+
+def seek_log_date(log, first_date):
+    """
+    Byte offset of the first line dated on or after `first_date`
+    The Telegram log is append-only, so its dates are ordered and a binary search over byte offsets finds it
+    """
+    lo, hi = 0, len(log)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        line_date = _log_line_date(log, log.rfind(b'\n', 0, mid) + 1)
+        if line_date is not None and line_date < first_date:
+            lo = mid + 1
+        else:
+            hi = mid
+    return log.rfind(b'\n', 0, lo) + 1
+
+
+class PriceCache:
+    """
+    Disk cache of one script's downloaded bars
+    Scripts download with their own settings (price adjustment, interval, trimming), so each keeps its
+    entries in its own directory rather than reading bars another script cached for the same window
+    """
+
+    def __init__(self, source, cache_dir=PRICE_CACHE_DIR):
+        self.cache_dir = Path(cache_dir) / source
+
+    def cache_file(self, ticker, start_date, end_date, interval):
+        """Disk cache file for a ticker's bars between dates"""
+        return self.cache_dir / f"{ticker}_{start_date}_{end_date}_{interval}.pkl"
+
+    def load(self, ticker, start_date, end_date, interval):
+        """Return cached bars for a ticker between dates, or None if they need fetching"""
+        cache_file = self.cache_file(ticker, start_date, end_date, interval)
+        try:
+            cached_at = pd.Timestamp(cache_file.stat().st_mtime, unit='s', tz='UTC')
+            # The end date is exclusive, so the window's last session is the day before it; bars written
+            # after that session ended in New York are final and never expire
+            last_session = pd.Timestamp(end_date) - pd.Timedelta(days=1)
+            window_end = (last_session + pd.Timedelta(hours=SESSION_END_HOUR)).tz_localize('America/New_York')
+            if cached_at < window_end and pd.Timestamp.now(tz='UTC') - cached_at > PRICE_CACHE_MAX_AGE:
+                return None
+            return pickle.loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️  Could not load cached prices for {ticker}: {e}")
+            return None
+
+    def store(self, ticker, start_date, end_date, interval, data):
+        """Atomically write downloaded bars to the disk cache"""
+        cache_file = self.cache_file(ticker, start_date, end_date, interval)
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"⚠️  Could not cache prices for {ticker}: {e}")
@@ -1,14 +1,50 @@
 #!/usr/bin/env python3
 
 import sys
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+# Cache the Google News feed responses so repeated debug runs stay local
+try:
+    import requests_cache
+    http = requests_cache.CachedSession('.http_cache', backend='sqlite', expire_after=timedelta(hours=1))
+except ImportError:
+    import requests as http
+
 sys.path.append('/home/abdza/data/kakikoding/trading/momentumscreener')
 from volume_momentum_tracker import VolumeMomentumTracker
-import requests
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+# lxml parses the feed in C; the stdlib parser has the same fromstring/findall API
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 tracker = VolumeMomentumTracker()
 
+@lru_cache(maxsize=None)
+def keyword_matcher(ticker):
+    """Build a matcher returning the ticker's keywords found in a lowercased title, compiled once per ticker"""
+    keywords = tracker._create_search_keywords(ticker)
+    if ahocorasick is None:
+        lowered = [(kw, kw.lower()) for kw in keywords]
+        return lambda title_lower: [kw for kw, kw_lower in lowered if kw_lower in title_lower]
+    
+    # One automaton pass over the title finds every keyword, however many there are
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw.lower(), kw.lower())
+    automaton.make_automaton()
+    
+    def match(title_lower):
+        found = {kw_lower for _, kw_lower in automaton.iter(title_lower)}
+        return [kw for kw in keywords if kw.lower() in found]
+    return match
+
 print('=== DEBUGGING Google News search for META ===')
 
 # Test the search step by step
@@ -31,7 +67,7 @@ headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-response = requests.get(url, headers=headers, timeout=10)
+response = http.get(url, headers=headers, timeout=10)
 print(f'Response status: {response.status_code}')
 
 root = ET.fromstring(response.content)
@@ -50,6 +86,5 @@ for i, item in enumerate(items[:3]):
         print(f'  Relevance: {is_relevant}')
         
         # Test what keywords match
-        keywords = tracker._create_search_keywords(ticker)
-        matching_keywords = [kw for kw in keywords if kw.lower() in title.lower()]
+        matching_keywords = keyword_matcher(ticker)(title.lower())
         print(f'  Matching keywords: {matching_keywords}')
\ No newline at end of file
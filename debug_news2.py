@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
 import sys
+from datetime import datetime, timedelta
+
+# Cache the Google News feed responses so repeated debug runs stay local
+try:
+    import requests_cache
+    http = requests_cache.CachedSession('.http_cache', backend='sqlite', expire_after=timedelta(hours=1))
+except ImportError:
+    import requests as http
+
 sys.path.append('/home/abdza/data/kakikoding/trading/momentumscreener')
 from volume_momentum_tracker import VolumeMomentumTracker
-import requests
-import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
 
 tracker = VolumeMomentumTracker()
 
@@ -21,15 +27,13 @@ headers = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-response = requests.get(url, headers=headers, timeout=10)
-root = ET.fromstring(response.content)
-items = root.findall('.//item')
+response = http.get(url, headers=headers, timeout=10)
 
 three_days_ago = datetime.now() - timedelta(days=3)
 print(f'Three days ago cutoff: {three_days_ago}')
 
-# Test first few items with full debugging
-for i, item in enumerate(items[:3]):
+# Test first few items with full debugging, streaming them the same way the tracker does
+for i, item in enumerate(tracker._iter_rss_items(response.content, 3)):
     title_elem = item.find('title')
     link_elem = item.find('link')
     pub_date_elem = item.find('pubDate')
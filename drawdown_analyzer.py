@@ -8,9 +8,80 @@ how much they dropped before hitting 30%+ gains.
 import json
 import glob
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import statistics
+
+import numpy as np
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+def _load_alert_file(file_path):
+    """Read and decode one alert file, returning None if it can't be read"""
+    try:
+        with open(file_path, 'rb') as f:
+            return json_loads(f.read())
+    except Exception:
+        return None
+
+ALERT_TYPE_CODES = {'price_spike': 0, 'premarket': 1}
+
+def _to_datetime64(timestamp):
+    """Wall-clock datetime64[ns] for a datetime (any tzinfo is dropped, as the alert times are naive)"""
+    return np.datetime64(timestamp.replace(tzinfo=None), 'ns')
+
+def _alert_window(times, alert_time):
+    """Index range of the points from the alert time to the end of its day within a sorted time slice"""
+    alert_ts = _to_datetime64(alert_time)
+    day_end = (alert_ts.astype('datetime64[D]') + np.timedelta64(1, 'D')).astype('datetime64[ns]')
+    return np.searchsorted(times, np.array([alert_ts, day_end]), side='left')
+
+def _window_extremes(prices, starts, ends):
+    """Min and max price of every non-empty [start, end) window in a single reduceat pass"""
+    bounds = np.column_stack((starts, ends)).ravel()
+    # The trailing pad lets a window end at the last row; odd slots (end to next start) are dropped
+    padded = np.append(prices, np.nan)
+    return np.minimum.reduceat(padded, bounds)[::2], np.maximum.reduceat(padded, bounds)[::2]
+
+def _drawdown_result(ticker, ticker_result, alert_time, times, prices, min_price_seen, max_price_seen):
+    """Build the drawdown summary for one ticker from its post-alert window and price extremes"""
+    alert_price = ticker_result['alert_price']
+    
+    # Prepend the alert itself so every series starts from the alert price
+    progression_times = np.concatenate(([_to_datetime64(alert_time)], times))
+    progression_prices = np.concatenate(([alert_price], prices))
+    
+    # Change and drawdown from the alert price for every point at once
+    change_from_alert = (progression_prices - alert_price) / alert_price * 100
+    drawdown_from_alert = np.where(progression_prices < alert_price, -change_from_alert, 0.0)
+    
+    # Calculate final metrics
+    final_max_gain = ((max_price_seen - alert_price) / alert_price) * 100
+    final_max_drawdown = ((alert_price - min_price_seen) / alert_price) * 100
+    
+    # Kept as columns; nothing in the report walks it point by point
+    price_progression = {
+        'timestamp': progression_times,
+        'price': progression_prices,
+        'change_from_alert': change_from_alert,
+        'drawdown_from_alert': drawdown_from_alert,
+    }
+    
+    return {
+        'ticker': ticker,
+        'alert_price': alert_price,
+        'alert_time': alert_time,
+        'max_price_seen': max_price_seen,
+        'min_price_seen': min_price_seen,
+        'max_gain_calculated': final_max_gain,
+        'max_gain_reported': ticker_result['max_gain'],
+        'max_drawdown_pct': final_max_drawdown,
+        'price_progression': price_progression,
+        'data_points': len(prices)
+    }
 
 class DrawdownAnalyzer:
     def __init__(self, 
@@ -28,54 +99,89 @@ class DrawdownAnalyzer:
         
         self.all_results = data['results']
         self.successful_tickers = data['successful_tickers']
+        # The list keeps report order; membership checks go through the set
+        self._successful_set = frozenset(self.successful_tickers)
         
         print(f"Loaded {len(self.successful_tickers)} successful tickers for drawdown analysis")
     
     def load_alert_files(self):
         """Load all alert files to track price movements"""
         alert_files = sorted(list(self.momentum_data_dir.glob("alerts_*.json")))
-        self.alerts_by_ticker = defaultdict(list)
+        tickers = []
+        file_times = []
+        file_counts = []
+        prices = []
+        changes = []
+        alert_types = []
         
         print(f"Loading {len(alert_files)} alert files...")
         
-        for file_path in alert_files:
+        # File reads overlap across threads; merging stays single-threaded and in file order
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            datas = list(pool.map(_load_alert_file, alert_files))
+        
+        for data in datas:
+            if data is None:
+                continue
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                timestamp = self._parse_timestamp(data['timestamp'])
+                # One datetime64 per file; it is repeated across the file's alerts when the columns are built
+                timestamp = _to_datetime64(self._parse_timestamp(data['timestamp']))
                 
                 # Extract all tickers and their prices from this timestamp
-                all_alerts = []
+                file_tickers = []
+                file_prices = []
+                file_changes = []
+                file_types = []
                 
                 # Price spikes
                 for alert in data.get('price_spikes', []):
-                    all_alerts.append({
-                        'ticker': alert['ticker'],
-                        'timestamp': timestamp,
-                        'price': alert['current_price'],
-                        'change_pct': alert['change_pct'],
-                        'alert_type': 'price_spike'
-                    })
+                    file_tickers.append(alert['ticker'])
+                    file_prices.append(alert['current_price'])
+                    file_changes.append(alert['change_pct'])
+                    file_types.append(ALERT_TYPE_CODES['price_spike'])
                 
                 # Premarket alerts
                 for alert in data.get('premarket_volume_alerts', []) + data.get('premarket_price_alerts', []):
-                    all_alerts.append({
-                        'ticker': alert['ticker'],
-                        'timestamp': timestamp,
-                        'price': alert['current_price'],
-                        'change_pct': alert.get('premarket_change', 0),
-                        'alert_type': 'premarket'
-                    })
+                    file_tickers.append(alert['ticker'])
+                    file_prices.append(alert['current_price'])
+                    file_changes.append(alert.get('premarket_change', 0))
+                    file_types.append(ALERT_TYPE_CODES['premarket'])
                 
-                # Group by ticker
-                for alert in all_alerts:
-                    self.alerts_by_ticker[alert['ticker']].append(alert)
+                tickers.extend(file_tickers)
+                prices.extend(file_prices)
+                changes.extend(file_changes)
+                alert_types.extend(file_types)
+                file_times.append(timestamp)
+                file_counts.append(len(file_tickers))
                     
             except Exception as e:
                 continue
         
-        print(f"Loaded price data for {len(self.alerts_by_ticker)} tickers")
+        times = np.repeat(np.array(file_times, dtype='datetime64[ns]'), file_counts)
+        self._build_alert_columns(tickers, times, prices, changes, alert_types)
+        
+        print(f"Loaded price data for {len(self.ticker_groups)} tickers")
+    
+    def _build_alert_columns(self, tickers, times, prices, changes, alert_types):
+        """Store alerts as columns sorted by (ticker, time) so each ticker's history is one slice"""
+        ticker_names, ticker_codes = np.unique(np.array(tickers, dtype=object), return_inverse=True)
+        time_column = np.asarray(times, dtype='datetime64[ns]')
+        # lexsort is stable, so alerts sharing a timestamp keep their file order
+        order = np.lexsort((time_column, ticker_codes))
+        
+        self.alert_columns = {
+            'ticker_code': ticker_codes[order],
+            'time': time_column[order],
+            'price': np.array(prices, dtype=np.float64)[order],
+            'change_pct': np.array(changes, dtype=np.float64)[order],
+            'alert_type': np.array(alert_types, dtype=np.int8)[order],
+        }
+        
+        group_starts = np.searchsorted(self.alert_columns['ticker_code'], np.arange(len(ticker_names) + 1))
+        self.ticker_groups = {
+            ticker: slice(group_starts[code], group_starts[code + 1])
+            for code, ticker in enumerate(ticker_names)
+        }
     
     def _parse_timestamp(self, timestamp_str):
         """Parse timestamp from various formats"""
@@ -92,89 +198,48 @@ class DrawdownAnalyzer:
                         continue
         raise ValueError(f"Could not parse timestamp: {timestamp_str}")
     
+    def _alert_windows(self, tickers):
+        """Alert time and [start, end) rows of the rest of the alert day for each ticker"""
+        alert_times = []
+        starts = np.zeros(len(tickers), dtype=np.intp)
+        ends = np.zeros(len(tickers), dtype=np.intp)
+        for i, ticker in enumerate(tickers):
+            alert_time = datetime.fromisoformat(self.all_results[ticker]['first_seen'])
+            alert_times.append(alert_time)
+            group = self.ticker_groups.get(ticker)
+            if group is not None:
+                start, end = _alert_window(self.alert_columns['time'][group], alert_time)
+                starts[i] = group.start + start
+                ends[i] = group.start + end
+        return alert_times, starts, ends
+    
+    def _analyze_drawdowns(self, tickers):
+        """Drawdown summaries for tickers (None where there is too little data), reducing all windows at once"""
+        alert_times, starts, ends = self._alert_windows(tickers)
+        usable = np.flatnonzero(ends - starts >= 2)
+        
+        analyses = [None] * len(tickers)
+        if not usable.size:
+            return analyses
+        
+        window_mins, window_maxs = _window_extremes(self.alert_columns['price'], starts[usable], ends[usable])
+        for i, window_min, window_max in zip(usable.tolist(), window_mins, window_maxs):
+            ticker = tickers[i]
+            ticker_result = self.all_results[ticker]
+            alert_price = ticker_result['alert_price']
+            rows = slice(starts[i], ends[i])
+            analyses[i] = _drawdown_result(
+                ticker, ticker_result, alert_times[i],
+                self.alert_columns['time'][rows], self.alert_columns['price'][rows],
+                min(window_min, alert_price), max(window_max, alert_price))
+        return analyses
+    
     def analyze_ticker_drawdown(self, ticker):
         """Analyze drawdown pattern for a specific successful ticker"""
-        if ticker not in self.successful_tickers:
+        if ticker not in self._successful_set:
             return None
         
-        ticker_result = self.all_results[ticker]
-        alert_time = datetime.fromisoformat(ticker_result['first_seen'])
-        alert_price = ticker_result['alert_price']
-        max_gain = ticker_result['max_gain']
-        
-        # Get all price points for this ticker on the same day
-        ticker_prices = self.alerts_by_ticker.get(ticker, [])
-        
-        if not ticker_prices:
-            return None
-        
-        # Filter to prices after the alert time on the same day
-        same_day_prices = []
-        alert_date = alert_time.date()
-        
-        for price_point in ticker_prices:
-            if price_point['timestamp'].date() == alert_date and price_point['timestamp'] >= alert_time:
-                same_day_prices.append(price_point)
-        
-        if len(same_day_prices) < 2:
-            return None
-        
-        # Sort by timestamp
-        same_day_prices.sort(key=lambda x: x['timestamp'])
-        
-        # Calculate drawdown from alert price
-        max_drawdown_pct = 0
-        min_price_seen = alert_price
-        max_price_seen = alert_price
-        
-        # Track price progression
-        price_progression = [{
-            'timestamp': alert_time,
-            'price': alert_price,
-            'change_from_alert': 0,
-            'drawdown_from_alert': 0
-        }]
-        
-        for price_point in same_day_prices:
-            current_price = price_point['price']
-            
-            # Update min/max
-            min_price_seen = min(min_price_seen, current_price)
-            max_price_seen = max(max_price_seen, current_price)
-            
-            # Calculate change from alert price
-            change_from_alert = ((current_price - alert_price) / alert_price) * 100
-            
-            # Calculate drawdown (negative change)
-            if current_price < alert_price:
-                drawdown = ((alert_price - current_price) / alert_price) * 100
-                max_drawdown_pct = max(max_drawdown_pct, drawdown)
-            else:
-                drawdown = 0
-            
-            price_progression.append({
-                'timestamp': price_point['timestamp'],
-                'price': current_price,
-                'change_from_alert': change_from_alert,
-                'drawdown_from_alert': drawdown
-            })
-        
-        # Calculate final metrics
-        final_max_gain = ((max_price_seen - alert_price) / alert_price) * 100
-        final_max_drawdown = ((alert_price - min_price_seen) / alert_price) * 100
-        
-        return {
-            'ticker': ticker,
-            'alert_price': alert_price,
-            'alert_time': alert_time,
-            'max_price_seen': max_price_seen,
-            'min_price_seen': min_price_seen,
-            'max_gain_calculated': final_max_gain,
-            'max_gain_reported': max_gain,
-            'max_drawdown_pct': final_max_drawdown,
-            'price_progression': price_progression,
-            'data_points': len(same_day_prices)
-        }
+        return self._analyze_drawdowns([ticker])[0]
     
     def analyze_all_successful_drawdowns(self):
         """Analyze drawdowns for all successful tickers"""
@@ -182,10 +247,11 @@ class DrawdownAnalyzer:
         
         print("Analyzing drawdowns for successful tickers...")
         
-        for i, ticker in enumerate(self.successful_tickers, 1):
-            print(f"Processing {ticker} ({i}/{len(self.successful_tickers)})...")
-            
-            analysis = self.analyze_ticker_drawdown(ticker)
+        tickers = list(self.successful_tickers)
+        analyses = self._analyze_drawdowns(tickers)
+        
+        for i, (ticker, analysis) in enumerate(zip(tickers, analyses), 1):
+            print(f"Processing {ticker} ({i}/{len(tickers)})...")
             if analysis and analysis['data_points'] >= 2:
                 drawdown_data.append(analysis)
         
@@ -199,36 +265,34 @@ class DrawdownAnalyzer:
             return None
         
         # Extract drawdown percentages
-        drawdowns = [data['max_drawdown_pct'] for data in drawdown_data if data['max_drawdown_pct'] > 0]
+        drawdowns = np.fromiter((data['max_drawdown_pct'] for data in drawdown_data), dtype=np.float64)
+        drawdowns = drawdowns[drawdowns > 0]
         
-        if not drawdowns:
+        if not drawdowns.size:
             return {
                 'message': 'No significant drawdowns found in successful tickers',
                 'recommendation': 'Most successful tickers did not drop below alert price'
             }
         
         # Calculate statistics
-        max_drawdown = max(drawdowns)
-        avg_drawdown = statistics.mean(drawdowns)
-        median_drawdown = statistics.median(drawdowns)
-        
-        # Calculate percentiles for stop-loss recommendations
-        drawdowns_sorted = sorted(drawdowns)
+        drawdowns_sorted = np.sort(drawdowns)
         n = len(drawdowns_sorted)
+        max_drawdown = drawdowns_sorted[-1]
+        avg_drawdown = drawdowns.mean()
+        median_drawdown = np.median(drawdowns_sorted)
         
-        percentile_75 = drawdowns_sorted[int(0.75 * n)] if n > 0 else 0
-        percentile_90 = drawdowns_sorted[int(0.90 * n)] if n > 0 else 0
-        percentile_95 = drawdowns_sorted[int(0.95 * n)] if n > 0 else 0
+        # Percentiles for stop-loss recommendations, taken by rank from the sorted drawdowns
+        percentile_75, percentile_90, percentile_95 = drawdowns_sorted[(np.array([0.75, 0.90, 0.95]) * n).astype(int)]
         
         # Calculate how many would be saved with different stop-loss levels
+        stop_levels = [5, 10, 15, 20, 25]
+        stopped_counts = n - np.searchsorted(drawdowns_sorted, stop_levels, side='left')
         stop_loss_analysis = {}
-        for stop_level in [5, 10, 15, 20, 25]:
-            tickers_stopped = sum(1 for dd in drawdowns if dd >= stop_level)
-            percentage_stopped = (tickers_stopped / len(drawdowns)) * 100
+        for stop_level, tickers_stopped in zip(stop_levels, stopped_counts.tolist()):
             stop_loss_analysis[stop_level] = {
                 'tickers_stopped': tickers_stopped,
-                'percentage_stopped': percentage_stopped,
-                'tickers_saved': len(drawdowns) - tickers_stopped
+                'percentage_stopped': (tickers_stopped / n) * 100,
+                'tickers_saved': n - tickers_stopped
             }
         
         return {
@@ -241,7 +305,7 @@ class DrawdownAnalyzer:
             'percentile_90': percentile_90,
             'percentile_95': percentile_95,
             'stop_loss_analysis': stop_loss_analysis,
-            'individual_drawdowns': drawdowns
+            'individual_drawdowns': drawdowns.tolist()
         }
     
     def generate_comprehensive_report(self):
@@ -25,16 +25,30 @@ import json
 import argparse
 import sys
 import asyncio
-from datetime import datetime, timedelta, date
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, date, time as dt_time
+from dataclasses import dataclass, field
 from pathlib import Path
-from collections import defaultdict
-import statistics
-import re
+
+import numpy as np
+import pandas as pd
+
+from data_utils import TIMESTAMP_DATE_RE, PriceCache, seek_log_date
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # For market data fetching
 try:
     import yfinance as yf
     import pytz
+    ET_TZ = pytz.timezone('America/New_York')
+    # Alert timestamps are logged in Malaysian time (UTC+8)
+    MALAYSIA_TZ = pytz.timezone('Asia/Kuala_Lumpur')
     YFINANCE_AVAILABLE = True
 except ImportError:
     print("⚠️  yfinance not available. Install with: pip install yfinance")
@@ -48,6 +62,74 @@ except ImportError:
     print("⚠️  python-telegram-bot not available. Install with: pip install python-telegram-bot")
     TELEGRAM_AVAILABLE = False
 
+# Telegram message limit, with headroom
+TELEGRAM_MAX_LENGTH = 4000
+
+def split_report(report, max_length=TELEGRAM_MAX_LENGTH):
+    """
+    Split a report into message-sized chunks on line boundaries
+    Cutting mid-line could split an HTML tag, which Telegram rejects
+    """
+    if len(report) <= max_length:
+        return [report]
+    
+    chunks = []
+    chunk_lines = []
+    chunk_length = 0
+    for line in report.split('\n'):
+        line_length = len(line) + 1
+        if chunk_lines and chunk_length + line_length > max_length:
+            chunks.append('\n'.join(chunk_lines) + '\n')
+            chunk_lines = []
+            chunk_length = 0
+        chunk_lines.append(line)
+        chunk_length += line_length
+    
+    if chunk_lines:
+        chunks.append('\n'.join(chunk_lines) + '\n')
+    return chunks
+
+# Days of bars fetched either side of the requested range, so the alert day is always covered
+FETCH_BUFFER_BEFORE = timedelta(days=5)
+FETCH_BUFFER_AFTER = timedelta(days=2)
+
+# Regular trading hours (ET)
+MARKET_OPEN = dt_time(9, 30)
+MARKET_CLOSE = dt_time(16, 0)
+
+# How far back Yahoo serves each intraday interval, finest first; daily bars go back indefinitely
+INTRADAY_LOOKBACKS = (('5m', timedelta(days=59)), ('1h', timedelta(days=729)))
+
+def price_intervals(start_date):
+    """Bar intervals Yahoo can serve from start_date on, finest first"""
+    age = date.today() - start_date
+    return [interval for interval, lookback in INTRADAY_LOOKBACKS if age <= lookback] + ['1d']
+
+
+@dataclass(slots=True)
+class AlertInfo:
+    """The first Telegram alert sent for a ticker, as analyzed and reported"""
+    ticker: str
+    timestamp: datetime
+    alert_type: str
+    alert_price: float
+    change_pct: float = 0
+    volume: float = 0
+    relative_volume: float = 0
+    sector: str = 'Unknown'
+    alert_count: int = 1
+    is_immediate_spike: bool = False
+    alert_types: list = field(default_factory=list)
+    win_probability_category: str = 'UNKNOWN'
+    estimated_win_probability: float = 0
+    pattern_flags: list = field(default_factory=list)
+    pattern_score: float = 0
+    
+    def to_dict(self):
+        """Shallow field dict, the base of a per-alert result row"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class EndOfDayAnalyzer:
     def __init__(self, data_dir="momentum_data", success_threshold=30.0,
                  telegram_bot_token=None, telegram_chat_id=None,
@@ -66,6 +148,10 @@ class EndOfDayAnalyzer:
         self.orb_data_dir = Path(orb_data_dir)
         self.success_threshold = success_threshold
         
+        # Price bars already fetched: in memory for this run, on disk across reruns
+        self.price_cache = {}
+        self.disk_price_cache = PriceCache('end_of_day_analyzer', self.data_dir / "price_cache")
+        
         # Initialize Telegram bot if credentials provided
         self.telegram_bot = None
         self.telegram_chat_id = telegram_chat_id
@@ -105,33 +191,61 @@ class EndOfDayAnalyzer:
         # A trading session includes pre-market, market hours, and after-hours
         # From 4:00 AM ET (start of pre-market) to 8:00 PM ET (end of after-hours)
         if YFINANCE_AVAILABLE:  # pytz available
-            ny_tz = pytz.timezone('America/New_York')
-            
             # Session starts at 4:00 AM ET on target date
-            session_start = ny_tz.localize(datetime.combine(target_date, datetime.min.time().replace(hour=4)))
+            session_start = ET_TZ.localize(datetime.combine(target_date, datetime.min.time().replace(hour=4)))
             
             # Session ends at 8:00 PM ET on target date  
-            session_end = ny_tz.localize(datetime.combine(target_date, datetime.min.time().replace(hour=20)))
+            session_end = ET_TZ.localize(datetime.combine(target_date, datetime.min.time().replace(hour=20)))
             
             # Convert to UTC for comparison
             session_start_utc = session_start.astimezone(pytz.UTC)
             session_end_utc = session_end.astimezone(pytz.UTC)
             
             print(f"🕐 NY Trading Session: {session_start.strftime('%Y-%m-%d %H:%M %Z')} to {session_end.strftime('%Y-%m-%d %H:%M %Z')}")
+            
+            # Whatever timezone a timestamp is written in, a session alert is dated within a day of the target
+            candidate_dates = tuple((target_date + timedelta(days=offset)).isoformat().encode()
+                                    for offset in (-1, 0, 1))
         else:
             # Fallback: use simple date string matching (original behavior)
             target_date_str = target_date.strftime('%Y-%m-%d')
             print(f"⚠️  pytz not available, using simple date matching for {target_date_str}")
+            candidate_dates = (target_date_str.encode(),)
+        
+        if telegram_log_file.stat().st_size == 0:
+            print(f"📱 Found 0 Telegram alerts sent for {target_date} NY trading session")
+            return []
         
         try:
-            with open(telegram_log_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
+            with open(telegram_log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+                # Jump past everything logged before the session could start instead of scanning the whole history
+                log.seek(seek_log_date(log, candidate_dates[0]))
+                last_date = candidate_dates[-1]
+                
+                while True:
+                    line_offset = log.tell()
+                    line = log.readline()
+                    if not line:
+                        break
                     line = line.strip()
                     if not line:
                         continue
                     
+                    # Read the timestamp's date off the raw bytes so lines outside the session are never decoded
+                    line_date = TIMESTAMP_DATE_RE.search(line)
+                    if line_date:
+                        line_date = line_date.group(1)
+                        # Dates only move forward, so the first line past the session's dates ends the scan
+                        if line_date > last_date:
+                            break
+                        if line_date not in candidate_dates:
+                            continue
+                    elif not any(date_bytes in line for date_bytes in candidate_dates):
+                        # Timestamp not laid out the usual way: fall back to a loose byte check
+                        continue
+                    
                     try:
-                        alert_data = json.loads(line)
+                        alert_data = json_loads(line)
                         alert_timestamp_str = alert_data.get('timestamp', '')
                         
                         if YFINANCE_AVAILABLE:
@@ -143,8 +257,7 @@ class EndOfDayAnalyzer:
                                 if alert_dt.tzinfo is None:
                                     # Try to determine if this is likely Malaysian time (UTC+8)
                                     # Malaysian alerts during NY session would typically be in evening/night local time
-                                    malaysia_tz = pytz.timezone('Asia/Kuala_Lumpur')
-                                    alert_dt = malaysia_tz.localize(alert_dt)
+                                    alert_dt = MALAYSIA_TZ.localize(alert_dt)
                                 
                                 # Convert to UTC for comparison
                                 alert_dt_utc = alert_dt.astimezone(pytz.UTC)
@@ -154,6 +267,7 @@ class EndOfDayAnalyzer:
                                     alerts_for_date.append(alert_data)
                                     
                             except (ValueError, TypeError) as e:
+                                line_num = log[:line_offset].count(b'\n') + 1
                                 print(f"⚠️  Could not parse timestamp on line {line_num}: {alert_timestamp_str}")
                                 # Fallback to simple date matching
                                 if alert_timestamp_str.startswith(target_date.strftime('%Y-%m-%d')):
@@ -164,6 +278,7 @@ class EndOfDayAnalyzer:
                                 alerts_for_date.append(alert_data)
                     
                     except json.JSONDecodeError as e:
+                        line_num = log[:line_offset].count(b'\n') + 1
                         print(f"⚠️  Skipping malformed JSON on line {line_num}: {e}")
                         continue
         
@@ -190,32 +305,30 @@ class EndOfDayAnalyzer:
                 # Convert Malaysian timestamp to timezone-aware format
                 # Alert timestamps are in Malaysian time (UTC+8)
                 if timestamp.tzinfo is None:
-                    malaysia_tz = pytz.timezone('Asia/Kuala_Lumpur')
-                    timestamp = malaysia_tz.localize(timestamp)
+                    timestamp = MALAYSIA_TZ.localize(timestamp)
                 alert_price = alert_data.get('alert_price', 0)
                 alert_type = alert_data.get('alert_type', 'price_spike')
 
                 # For Telegram alerts, we only keep the first one per ticker
                 # since these are the actual alerts the user received
                 if ticker not in ticker_first_alerts:
-                    alert_info = {
-                        'ticker': ticker,
-                        'timestamp': timestamp,
-                        'alert_type': alert_type,
-                        'alert_price': alert_price,
-                        'change_pct': alert_data.get('change_pct', 0),
-                        'volume': alert_data.get('volume', 0),
-                        'relative_volume': alert_data.get('relative_volume', 0),
-                        'sector': alert_data.get('sector', 'Unknown'),
-                        'alert_count': alert_data.get('alert_count', 1),
-                        'is_immediate_spike': alert_data.get('is_immediate_spike', False),
-                        'alert_types': alert_data.get('alert_types', [alert_type]),
-                        'win_probability_category': alert_data.get('win_probability_category', 'UNKNOWN'),
-                        'estimated_win_probability': alert_data.get('estimated_win_probability', 0),
-                        'pattern_flags': alert_data.get('pattern_flags', []),
-                        'pattern_score': alert_data.get('pattern_score', 0),
-                        'original_alert': alert_data
-                    }
+                    alert_info = AlertInfo(
+                        ticker=ticker,
+                        timestamp=timestamp,
+                        alert_type=alert_type,
+                        alert_price=alert_price,
+                        change_pct=alert_data.get('change_pct', 0),
+                        volume=alert_data.get('volume', 0),
+                        relative_volume=alert_data.get('relative_volume', 0),
+                        sector=alert_data.get('sector', 'Unknown'),
+                        alert_count=alert_data.get('alert_count', 1),
+                        is_immediate_spike=alert_data.get('is_immediate_spike', False),
+                        alert_types=alert_data.get('alert_types', [alert_type]),
+                        win_probability_category=alert_data.get('win_probability_category', 'UNKNOWN'),
+                        estimated_win_probability=alert_data.get('estimated_win_probability', 0),
+                        pattern_flags=alert_data.get('pattern_flags', []),
+                        pattern_score=alert_data.get('pattern_score', 0)
+                    )
                     
                     ticker_first_alerts[ticker] = alert_info
                     all_alerts.append(alert_info)
@@ -230,48 +343,53 @@ class EndOfDayAnalyzer:
         print(f"📊 Extracted {len(all_alerts)} unique Telegram alerts")
         return all_alerts
     
+    def _load_cached_price_data(self, ticker, start_date, end_date):
+        """Return cached bars for a ticker between dates, or None if they need fetching"""
+        key = (ticker, start_date, end_date)
+        if key in self.price_cache:
+            return self.price_cache[key]
+        
+        # The window runs through the end date's session, so the disk cache's exclusive end is the day after;
+        # the interval is whichever finest one Yahoo served
+        data = self.disk_price_cache.load(ticker, start_date, end_date + timedelta(days=1), 'finest')
+        if data is not None:
+            self.price_cache[key] = data
+        return data
+    
+    def _store_price_data(self, ticker, start_date, end_date, data):
+        """Keep fetched bars in memory and write them to the disk cache"""
+        self.price_cache[(ticker, start_date, end_date)] = data
+        self.disk_price_cache.store(ticker, start_date, end_date + timedelta(days=1), 'finest', data)
+    
     def fetch_price_data(self, ticker, start_date, end_date):
         """Fetch price data for a ticker between dates"""
         if not YFINANCE_AVAILABLE:
             return None
+        
+        cached = self._load_cached_price_data(ticker, start_date, end_date)
+        if cached is not None:
+            return cached
             
         try:
             # Add buffer days to ensure we get data
-            start_with_buffer = start_date - timedelta(days=5)
-            end_with_buffer = end_date + timedelta(days=2)
+            start_with_buffer = start_date - FETCH_BUFFER_BEFORE
+            end_with_buffer = end_date + FETCH_BUFFER_AFTER
             
             stock = yf.Ticker(ticker)
             
-            # Try different data fetching strategies
-            strategies = [
-                # Strategy 1: 5-minute intraday data
-                {'interval': '5m', 'start': start_with_buffer, 'end': end_with_buffer},
-                # Strategy 2: 15-minute data (more reliable)
-                {'interval': '15m', 'start': start_with_buffer, 'end': end_with_buffer},
-                # Strategy 3: 1-hour data
-                {'interval': '1h', 'start': start_with_buffer, 'end': end_with_buffer},
-                # Strategy 4: Daily data with date range
-                {'interval': '1d', 'start': start_with_buffer, 'end': end_with_buffer},
-                # Strategy 5: Recent period-based fetch
-                {'period': '5d', 'interval': '1d'},
-                # Strategy 6: Longer period as fallback
-                {'period': '1mo', 'interval': '1d'}
-            ]
-            
-            for i, strategy in enumerate(strategies, 1):
+            # Start at the finest interval Yahoo still serves for this window; coarser ones only if it comes back empty
+            for interval in price_intervals(start_with_buffer):
                 try:
-                    if 'period' in strategy:
-                        data = stock.history(period=strategy['period'], interval=strategy['interval'])
-                    else:
-                        data = stock.history(start=strategy['start'], end=strategy['end'], interval=strategy['interval'])
+                    data = stock.history(start=start_with_buffer, end=end_with_buffer, interval=interval)
                     
                     if not data.empty:
+                        self._store_price_data(ticker, start_date, end_date, data)
                         return data
                         
-                except Exception as strategy_error:
+                except Exception as interval_error:
                     continue
             
-            # If all strategies fail, return None
+            # If every interval fails, return None
             return None
             
         except Exception as e:
@@ -285,17 +403,85 @@ class EndOfDayAnalyzer:
                 print(f"⚠️  {ticker}: {str(e)[:100]}...")
             return None
     
-    def analyze_ticker_performance(self, alert_info, target_date):
-        """Analyze a single ticker's performance after alert"""
-        ticker = alert_info['ticker']
-        alert_time = alert_info['timestamp']
-        alert_price = alert_info['alert_price']
-        
+    def _alert_date_range(self, alert_info, target_date):
+        """Date range of price data an alert needs: from the alert's date through the target session"""
         # Fetch price data from alert time to market close (4:00 PM ET)
         # Note: Alert timestamp might be in local time, so we fetch broader range
         market_close = datetime.combine(target_date, datetime.min.time().replace(hour=20))  # 8 PM ET for buffer
+        return alert_info.timestamp.date(), market_close.date()
+    
+    def fetch_alert_price_data(self, alert_info, target_date):
+        """Fetch the price data covering an alert through the end of the target session"""
+        start_date, end_date = self._alert_date_range(alert_info, target_date)
+        return self.fetch_price_data(alert_info.ticker, start_date, end_date)
+    
+    def download_alert_price_data(self, all_alerts, target_date):
+        """
+        Download the finest available bars for every alerted ticker not already cached in one batched request
+        
+        Returns:
+            dict: ticker -> bars, trimmed to the same buffered window fetch_price_data would request.
+                  Tickers missing from the batch are left out so callers can fetch them individually.
+        """
+        if not YFINANCE_AVAILABLE or not all_alerts:
+            return {}
+        
+        price_data = {}
+        windows = {}
+        alert_ranges = {}
+        for alert_info in all_alerts:
+            ticker = alert_info.ticker
+            start_date, end_date = self._alert_date_range(alert_info, target_date)
+            cached = self._load_cached_price_data(ticker, start_date, end_date)
+            if cached is not None:
+                price_data[ticker] = cached
+                continue
+            windows[ticker] = (start_date - FETCH_BUFFER_BEFORE, end_date + FETCH_BUFFER_AFTER)
+            alert_ranges[ticker] = (start_date, end_date)
+        
+        if not windows:
+            return price_data
+        
+        try:
+            batch_start = min(w[0] for w in windows.values())
+            data = yf.download(list(windows), start=batch_start,
+                               end=max(w[1] for w in windows.values()), interval=price_intervals(batch_start)[0],
+                               group_by='ticker', auto_adjust=True, threads=True, progress=False)
+        except Exception as e:
+            print(f"⚠️  Batch price download failed, fetching tickers individually: {str(e)[:100]}")
+            return price_data
+        
+        if data is None or data.empty:
+            return price_data
         
-        price_data = self.fetch_price_data(ticker, alert_time.date(), market_close.date())
+        for ticker, (start_date, end_date) in windows.items():
+            if data.columns.nlevels > 1:
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                frame = data[ticker]
+            else:
+                frame = data
+            
+            # The batch shares one index across tickers, so drop rows where this one had no bar
+            frame = frame.dropna(how='all')
+            bar_dates = frame.index.date
+            frame = frame[(bar_dates >= start_date) & (bar_dates < end_date)]
+            if not frame.empty:
+                price_data[ticker] = frame
+                self._store_price_data(ticker, *alert_ranges[ticker], frame)
+        
+        return price_data
+    
+    def analyze_ticker_performance(self, alert_info, target_date):
+        """Analyze a single ticker's performance after alert"""
+        price_data = self.fetch_alert_price_data(alert_info, target_date)
+        return self._analyze_from_price_data(alert_info, price_data, target_date)
+    
+    def _analyze_from_price_data(self, alert_info, price_data, target_date):
+        """Compute a ticker's performance after its alert from already-fetched price data"""
+        ticker = alert_info.ticker
+        alert_time = alert_info.timestamp
+        alert_price = alert_info.alert_price
         
         if price_data is None or price_data.empty:
             return {
@@ -316,8 +502,7 @@ class EndOfDayAnalyzer:
             elif price_data.index.tz is not None and alert_time.tzinfo is None:
                 # Price data is timezone-aware but alert_time isn't - this shouldn't happen now
                 # since we're making alert_time timezone-aware in extract_alerts_from_telegram_log
-                et_tz = pytz.timezone('America/New_York')
-                alert_time = et_tz.localize(alert_time)
+                alert_time = ET_TZ.localize(alert_time)
             elif price_data.index.tz is None and alert_time.tzinfo is not None:
                 # Convert timezone-aware alert_time to naive to match price_data
                 alert_time = alert_time.replace(tzinfo=None)
@@ -328,19 +513,16 @@ class EndOfDayAnalyzer:
             # Skip time filtering if alert timestamp seems to be in wrong timezone
             alert_hour = alert_time.hour
             if 6 <= alert_hour <= 20:  # Reasonable trading day hours
-                price_data = price_data[price_data.index >= alert_time]
+                # Bars are in time order, so a binary search finds the first one at or after the alert
+                price_data = price_data.iloc[price_data.index.searchsorted(alert_time):]
             else:
                 print(f"Note: {ticker} skipping time filter (alert at {alert_hour}:xx may be wrong timezone)")
             
             # Filter to regular trading hours only (9:30 AM - 4:00 PM ET)
             # This removes premarket and aftermarket data
             if hasattr(price_data.index, 'tz') and price_data.index.tz:
-                # Data is timezone-aware, filter by time
-                trading_hours_mask = (
-                    (price_data.index.time >= datetime.strptime('09:30', '%H:%M').time()) &
-                    (price_data.index.time <= datetime.strptime('16:00', '%H:%M').time())
-                )
-                trading_hours_data = price_data[trading_hours_mask]
+                # Data is timezone-aware, filter by its wall-clock time
+                trading_hours_data = price_data.between_time(MARKET_OPEN, MARKET_CLOSE)
                 
                 # If no trading hours data, use all data (might be timezone issue)
                 if not trading_hours_data.empty:
@@ -371,7 +553,9 @@ class EndOfDayAnalyzer:
             }
         
         # Filter price data to target date only (ignore data from other days)
-        target_date_only = price_data[price_data.index.date == target_date]
+        # Partial-string slice on the sorted index; empty rather than KeyError when the day is missing
+        session_day = target_date.isoformat()
+        target_date_only = price_data.loc[session_day:session_day]
         
         if target_date_only.empty:
             # If no data for target date, fall back to all data but log warning
@@ -382,42 +566,24 @@ class EndOfDayAnalyzer:
         
         # Calculate performance metrics using ALERT PRICE as baseline
         # This measures actual gain from when the first alert was sent
-        high_prices = final_data['High'].values
-        low_prices = final_data['Low'].values
+        high_prices = final_data['High'].to_numpy(dtype=np.float64)
+        low_prices = final_data['Low'].to_numpy(dtype=np.float64)
         close_prices = final_data['Close'].values
         
         # Maximum gain calculation FROM ALERT PRICE (not previous day close)
-        max_high = max(high_prices)
+        max_high = np.nanmax(high_prices)
         max_gain_pct = ((max_high - alert_price) / alert_price) * 100
         
-        # Maximum drawdown calculation (worst drop from alert price before achieving success)
-        max_drawdown_pct = 0
-        success_achieved = False
+        # Success is the first bar whose high reaches the threshold
         success_price = alert_price * (1 + self.success_threshold / 100)
+        hits = high_prices >= success_price
+        success_achieved = bool(hits.any())
+        success_idx = int(hits.argmax()) if success_achieved else len(high_prices)
         
-        current_min = alert_price
-        for i, (high, low, close) in enumerate(zip(high_prices, low_prices, close_prices)):
-            # Check if success threshold was hit
-            if high >= success_price:
-                success_achieved = True
-                break
-            
-            # Track the lowest point so far
-            current_min = min(current_min, low)
-            
-            # Calculate drawdown from alert price
-            drawdown = ((current_min - alert_price) / alert_price) * 100
-            max_drawdown_pct = min(max_drawdown_pct, drawdown)  # More negative = larger drawdown
-        
-        # If success was achieved after some drawdown, continue tracking until success
-        if success_achieved:
-            # Find the exact point where success was achieved
-            for i, (high, low, close) in enumerate(zip(high_prices, low_prices, close_prices)):
-                if high >= success_price:
-                    break
-                current_min = min(current_min, low)
-                drawdown = ((current_min - alert_price) / alert_price) * 100
-                max_drawdown_pct = min(max_drawdown_pct, drawdown)
+        # Maximum drawdown: worst low from alert price over the bars before success (0 if it never dipped)
+        # fmin skips NaN bars and starting from the alert price covers an empty window, all in one pass
+        lowest = np.fmin.reduce(low_prices[:success_idx], initial=alert_price)
+        max_drawdown_pct = ((lowest - alert_price) / alert_price) * 100
         
         # Final price at end of analysis period
         end_price = close_prices[-1]
@@ -463,26 +629,39 @@ class EndOfDayAnalyzer:
         print(f"\n📈 ANALYZING {len(all_alerts)} TICKERS...")
         print("-" * 60)
         
-        for i, alert_info in enumerate(all_alerts, 1):
-            ticker = alert_info['ticker']
-            alert_type = alert_info['alert_type']
-            
-            ticker_link = self.format_ticker_link(ticker)
-            print(f"[{i:2d}/{len(all_alerts)}] Analyzing {ticker_link} ({alert_type})...", end=' ')
-            
-            performance = self.analyze_ticker_performance(alert_info, target_date)
-            
-            result = {
-                **alert_info,
-                **performance
-            }
-            results.append(result)
+        # One batched request covers most tickers; anything it missed goes through the per-ticker fallbacks
+        batch_price_data = self.download_alert_price_data(all_alerts, target_date)
+        
+        # Price fetches are network-bound, so run them concurrently and analyze in alert order as they land
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            price_futures = [None if alert_info.ticker in batch_price_data
+                             else executor.submit(self.fetch_alert_price_data, alert_info, target_date)
+                             for alert_info in all_alerts]
             
-            if performance['data_available']:
-                success_marker = "✅" if performance['success'] else "❌"
-                print(f"{success_marker} Max: {performance['max_gain']:+5.1f}% | DD: {performance['max_drawdown']:4.1f}%")
-            else:
-                print(f"⚠️  No data available")
+            for i, (alert_info, price_future) in enumerate(zip(all_alerts, price_futures), 1):
+                ticker = alert_info.ticker
+                alert_type = alert_info.alert_type
+                
+                ticker_link = self.format_ticker_link(ticker)
+                print(f"[{i:2d}/{len(all_alerts)}] Analyzing {ticker_link} ({alert_type})...", end=' ')
+                
+                if price_future is None:
+                    price_data = batch_price_data[ticker]
+                else:
+                    price_data = price_future.result()
+                performance = self._analyze_from_price_data(alert_info, price_data, target_date)
+                
+                result = {
+                    **alert_info.to_dict(),
+                    **performance
+                }
+                results.append(result)
+                
+                if performance['data_available']:
+                    success_marker = "✅" if performance['success'] else "❌"
+                    print(f"{success_marker} Max: {performance['max_gain']:+5.1f}% | DD: {performance['max_drawdown']:4.1f}%")
+                else:
+                    print(f"⚠️  No data available")
         
         return results
     
@@ -500,9 +679,6 @@ class EndOfDayAnalyzer:
             print("⚠️  pytz/yfinance not available - skipping ORB analysis")
             return []
 
-        malaysia_tz = pytz.timezone('Asia/Kuala_Lumpur')
-        et_tz = pytz.timezone('America/New_York')
-
         scans = {}  # range_minutes -> {'label', 'range_minutes', 'tickers': {name: record}}
 
         for json_file in sorted(self.orb_data_dir.glob('screener_*.json')):
@@ -519,8 +695,8 @@ class EndOfDayAnalyzer:
             except (ValueError, TypeError):
                 continue
             if ts.tzinfo is None:
-                ts = malaysia_tz.localize(ts)
-            ts_et = ts.astimezone(et_tz)
+                ts = MALAYSIA_TZ.localize(ts)
+            ts_et = ts.astimezone(ET_TZ)
 
             if ts_et.date() != target_date:
                 continue
@@ -551,7 +727,6 @@ class EndOfDayAnalyzer:
         if not YFINANCE_AVAILABLE:
             return None
 
-        et_tz = pytz.timezone('America/New_York')
         stock = yf.Ticker(ticker)
 
         for interval in ('5m', '15m'):
@@ -564,9 +739,9 @@ class EndOfDayAnalyzer:
                 continue
             try:
                 if data.index.tz is None:
-                    data.index = data.index.tz_localize(et_tz)
+                    data.index = data.index.tz_localize(ET_TZ)
                 else:
-                    data.index = data.index.tz_convert(et_tz)
+                    data.index = data.index.tz_convert(ET_TZ)
             except Exception:
                 continue
             data = data[data.index.date == target_date]
@@ -584,12 +759,9 @@ class EndOfDayAnalyzer:
         if data is None or data.empty:
             return {'outcome': 'no_data'}
 
-        et_tz = pytz.timezone('America/New_York')
-        open_time = et_tz.localize(datetime.combine(
-            target_date, datetime.min.time().replace(hour=9, minute=30)))
+        open_time = ET_TZ.localize(datetime.combine(target_date, MARKET_OPEN))
         range_end = open_time + timedelta(minutes=range_minutes)
-        close_time = et_tz.localize(datetime.combine(
-            target_date, datetime.min.time().replace(hour=16)))
+        close_time = ET_TZ.localize(datetime.combine(target_date, MARKET_CLOSE))
 
         range_bars = data[(data.index >= open_time) & (data.index < range_end)]
         after_bars = data[(data.index >= range_end) & (data.index < close_time)]
@@ -770,40 +942,34 @@ Win Rate (resolved trades): {win_rate:.0f}% ({len(wins)}/{resolved})"""
         if not valid_results:
             return "❌ No valid data available for analysis"
         
+        # One frame of the metrics the report needs; every statistic below is a column reduction
+        df = pd.DataFrame(valid_results, columns=['alert_type', 'success', 'max_gain', 'max_drawdown']).astype(
+            {'success': bool, 'max_gain': np.float64, 'max_drawdown': np.float64})
+        gains = df['max_gain']
+        drawdowns = df['max_drawdown']
+        success = df['success']
+        alert_types = df['alert_type']
+        
         # Calculate overall statistics
         total_alerts = len(valid_results)
-        successful_alerts = [r for r in valid_results if r['success']]
-        success_count = len(successful_alerts)
+        success_count = int(success.sum())
         success_rate = (success_count / total_alerts) * 100
         
         # Performance statistics
-        all_gains = [r['max_gain'] for r in valid_results]
-        successful_gains = [r['max_gain'] for r in successful_alerts]
-        all_drawdowns = [r['max_drawdown'] for r in valid_results]
-        successful_drawdowns = [r['max_drawdown'] for r in successful_alerts]
-        
-        avg_gain = statistics.mean(all_gains)
-        avg_successful_gain = statistics.mean(successful_gains) if successful_gains else 0
-        avg_drawdown = statistics.mean(all_drawdowns)
-        avg_successful_drawdown = statistics.mean(successful_drawdowns) if successful_drawdowns else 0
-        max_drawdown = max(all_drawdowns) if all_drawdowns else 0
+        avg_gain = gains.mean()
+        avg_successful_gain = gains[success].mean() if success_count else 0
+        avg_drawdown = drawdowns.mean()
+        avg_successful_drawdown = drawdowns[success].mean() if success_count else 0
+        max_drawdown = drawdowns.max()
         
-        # Alert type breakdown
-        type_stats = defaultdict(lambda: {'total': 0, 'successful': 0, 'gains': [], 'drawdowns': []})
+        # Alert type breakdown (groupby sorts the types)
+        group_stats = dict(total=('success', 'size'), successful=('success', 'sum'),
+                           avg_gain=('max_gain', 'mean'), avg_dd=('max_drawdown', 'mean'))
+        type_stats = df.groupby('alert_type').agg(**group_stats)
         
-        for result in valid_results:
-            alert_type = result['alert_type']
-            type_stats[alert_type]['total'] += 1
-            type_stats[alert_type]['gains'].append(result['max_gain'])
-            type_stats[alert_type]['drawdowns'].append(result['max_drawdown'])
-            
-            if result['success']:
-                type_stats[alert_type]['successful'] += 1
-        
-        # Flat-to-spike analysis (if available)
-        flat_to_spike_results = [r for r in valid_results if r['alert_type'] == 'flat_to_spike']
-        regular_spike_results = [r for r in valid_results if r['alert_type'] == 'price_spike']
-        premarket_results = [r for r in valid_results if r['alert_type'].startswith('premarket')]
+        # Flat-to-spike analysis (if available): one grouping pass with the premarket variants pooled
+        buckets = alert_types.mask(alert_types.str.startswith('premarket'), 'premarket')
+        bucket_stats = {stats.Index: stats for stats in df.groupby(buckets).agg(**group_stats).itertuples()}
         
         # Generate report
         report = f"""<b>📊 END-OF-DAY TELEGRAM ALERT ANALYSIS - {target_date}</b>
@@ -828,52 +994,32 @@ Maximum Drawdown: {max_drawdown:4.1f}%
 <b>🏷️  ALERT TYPE BREAKDOWN</b>
 {'─'*30}"""
 
-        for alert_type, stats in sorted(type_stats.items()):
-            if stats['total'] > 0:
-                type_success_rate = (stats['successful'] / stats['total']) * 100
-                type_avg_gain = statistics.mean(stats['gains'])
-                type_avg_drawdown = statistics.mean(stats['drawdowns'])
-                
-                report += f"""
-{alert_type.replace('_', ' ').title():20} | {stats['successful']:2d}/{stats['total']:2d} ({type_success_rate:4.1f}%) | Gain: {type_avg_gain:+5.1f}% | DD: {type_avg_drawdown:4.1f}%"""
+        for alert_type, type_total, type_successful, type_avg_gain, type_avg_drawdown in type_stats.itertuples():
+            type_success_rate = (type_successful / type_total) * 100
+            
+            report += f"""
+{alert_type.replace('_', ' ').title():20} | {type_successful:2d}/{type_total:2d} ({type_success_rate:4.1f}%) | Gain: {type_avg_gain:+5.1f}% | DD: {type_avg_drawdown:4.1f}%"""
 
         # Enhanced flat-to-spike analysis
-        if flat_to_spike_results or regular_spike_results:
+        if 'flat_to_spike' in bucket_stats or 'price_spike' in bucket_stats:
             report += f"""
 
 <b>🎯 FLAT-TO-SPIKE ANALYSIS</b>
 {'─'*30}"""
             
-            if flat_to_spike_results:
-                flat_success = len([r for r in flat_to_spike_results if r['success']])
-                flat_rate = (flat_success / len(flat_to_spike_results)) * 100 if flat_to_spike_results else 0
-                flat_avg_gain = statistics.mean([r['max_gain'] for r in flat_to_spike_results])
-                flat_avg_dd = statistics.mean([r['max_drawdown'] for r in flat_to_spike_results])
-                
-                report += f"""
-Verified Flat-to-Spike: {flat_success}/{len(flat_to_spike_results)} ({flat_rate:.1f}%) | Gain: {flat_avg_gain:+5.1f}% | DD: {flat_avg_dd:4.1f}%"""
-            
-            if regular_spike_results:
-                reg_success = len([r for r in regular_spike_results if r['success']])
-                reg_rate = (reg_success / len(regular_spike_results)) * 100 if regular_spike_results else 0
-                reg_avg_gain = statistics.mean([r['max_gain'] for r in regular_spike_results])
-                reg_avg_dd = statistics.mean([r['max_drawdown'] for r in regular_spike_results])
-                
-                report += f"""
-Regular Price Spikes:   {reg_success}/{len(regular_spike_results)} ({reg_rate:.1f}%) | Gain: {reg_avg_gain:+5.1f}% | DD: {reg_avg_dd:4.1f}%"""
-            
-            if premarket_results:
-                pm_success = len([r for r in premarket_results if r['success']])
-                pm_rate = (pm_success / len(premarket_results)) * 100 if premarket_results else 0
-                pm_avg_gain = statistics.mean([r['max_gain'] for r in premarket_results])
-                pm_avg_dd = statistics.mean([r['max_drawdown'] for r in premarket_results])
+            for bucket, label in (('flat_to_spike', 'Verified Flat-to-Spike:'),
+                                  ('price_spike', 'Regular Price Spikes:'),
+                                  ('premarket', 'Premarket Alerts:')):
+                if bucket not in bucket_stats:
+                    continue
+                stats = bucket_stats[bucket]
+                bucket_rate = (stats.successful / stats.total) * 100
                 
                 report += f"""
-Premarket Alerts:       {pm_success}/{len(premarket_results)} ({pm_rate:.1f}%) | Gain: {pm_avg_gain:+5.1f}% | DD: {pm_avg_dd:4.1f}%"""
+{label:23} {stats.successful}/{stats.total} ({bucket_rate:.1f}%) | Gain: {stats.avg_gain:+5.1f}% | DD: {stats.avg_dd:4.1f}%"""
 
         # All successful alerts
-        all_successful = sorted([r for r in valid_results if r['success']], 
-                              key=lambda x: x['max_gain'], reverse=True)
+        all_successful = [valid_results[i] for i in gains[success].sort_values(ascending=False, kind='stable').index]
         
         if all_successful:
             report += f"""
@@ -888,7 +1034,7 @@ Premarket Alerts:       {pm_success}/{len(premarket_results)} ({pm_rate:.1f}%) |
 {i:2d}. {ticker_link} | {result['max_gain']:+6.1f}% | DD: {result['max_drawdown']:4.1f}% | Alert: {alert_time} | Win Prob: {win_prob_display} | {result['alert_type'].replace('_', ' ').title()}"""
 
         # Worst drawdowns
-        worst_drawdowns = sorted(valid_results, key=lambda x: x['max_drawdown'], reverse=True)[:5]
+        worst_drawdowns = [valid_results[i] for i in drawdowns.nlargest(5).index]
         
         if worst_drawdowns:
             report += f"""
@@ -918,27 +1064,9 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             return
         
         try:
-            # Split report into chunks if too long
-            max_length = 4000  # Telegram message limit
-            
-            if len(report) <= max_length:
-                await self.telegram_bot.send_message(self.telegram_chat_id, report, parse_mode='HTML')
-            else:
-                # Split into chunks
-                lines = report.split('\n')
-                current_chunk = ""
-
-                for line in lines:
-                    if len(current_chunk + line + "\n") <= max_length:
-                        current_chunk += line + "\n"
-                    else:
-                        if current_chunk:
-                            await self.telegram_bot.send_message(self.telegram_chat_id, current_chunk, parse_mode='HTML')
-                        current_chunk = line + "\n"
-                
-                # Send remaining chunk
-                if current_chunk:
-                    await self.telegram_bot.send_message(self.telegram_chat_id, current_chunk, parse_mode='HTML')
+            # Chunks go out one after another: concurrent sends can arrive out of order and scramble the report
+            for chunk in split_report(report):
+                await self.telegram_bot.send_message(self.telegram_chat_id, chunk, parse_mode='HTML')
             
             print("📱 Telegram report sent successfully")
             
@@ -980,8 +1108,7 @@ async def main():
     else:
         # Use New York timezone for default date (market time)
         if YFINANCE_AVAILABLE:  # pytz is imported with yfinance
-            ny_tz = pytz.timezone('America/New_York')
-            ny_now = datetime.now(ny_tz)
+            ny_now = datetime.now(ET_TZ)
             target_date = ny_now.date()
             print(f"🕐 Using New York time: {ny_now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
         else:
@@ -5,19 +5,102 @@ Advanced analysis of telegram alert data with focus on success patterns,
 flat-to-spike detection, and performance optimization recommendations.
 """
 
+import io
 import json
 import os
-import glob
-from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime, timedelta
-import statistics
 import sys
+from operator import itemgetter
+
+import numpy as np
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Alert lists in each snapshot file; an alert's position here is its 'atype' code
+ALERT_TYPES = ('volume_climbers', 'volume_newcomers', 'price_spikes',
+               'premarket_volume_alerts', 'premarket_price_alerts')
+VOLUME_CLIMBERS, VOLUME_NEWCOMERS, PRICE_SPIKES, PREMARKET_VOLUME, PREMARKET_PRICE = range(len(ALERT_TYPES))
+
+# The only alert fields the analyses read, with the value used when an alert lacks one
+# (a NaN relative volume marks it as missing so averages can skip it)
+ALERT_FIELD_DEFAULTS = (('ticker', None), ('sector', 'Unknown'), ('change_from_open', 0),
+                        ('change_pct', 0), ('relative_volume', np.nan))
+_alert_row = itemgetter(*(field for field, _ in ALERT_FIELD_DEFAULTS))
+
+def _alert_values(alert):
+    """
+    An alert's analyzed fields as a tuple in ALERT_FIELD_DEFAULTS order
+    Ticker and sector strings are interned, so every snapshot of a ticker shares one string object
+    """
+    try:
+        # Fast path: one C-level lookup when every field is present
+        ticker, sector, change_from_open, change_pct, relative_volume = _alert_row(alert)
+    except KeyError:
+        ticker, sector, change_from_open, change_pct, relative_volume = (
+            alert.get(field, default) for field, default in ALERT_FIELD_DEFAULTS)
+    if type(ticker) is str:
+        ticker = sys.intern(ticker)
+    if type(sector) is str:
+        sector = sys.intern(sector)
+    return ticker, sector, change_from_open, change_pct, relative_volume
+
+def _load_alert_file(file_path):
+    """
+    Read and decode one alert file, returning (data, error)
+    Each alert list is reduced to tuples of the analyzed fields, so the rest of each snapshot is freed straight away
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            data = json_loads(f.read())
+        return {alert_type: [_alert_values(alert) for alert in data.get(alert_type) or ()]
+                for alert_type in ALERT_TYPES}, None
+    except Exception as e:
+        return None, e
+
+def _mean(values):
+    """Mean of an array, 0 when it is empty"""
+    return float(values.mean()) if values.size else 0.0
+
+def _rank_percentiles(values, fractions):
+    """The values a full sort would put at int(len * fraction), found by selection instead"""
+    ranks = (np.asarray(fractions) * len(values)).astype(int)
+    return np.partition(values, ranks)[ranks]
+
+def _top_rows(rows, values, n):
+    """
+    The rows holding the n largest values, largest first, with ties left in row order
+    Selection trims the candidates to those at or above the n-th largest value before the (stable) sort
+    """
+    if len(values) > n:
+        nth_largest = np.partition(values, len(values) - n)[len(values) - n]
+        keep = values >= nth_largest
+        rows, values = rows[keep], values[keep]
+    return rows[np.argsort(-values, kind='stable')[:n]]
+
+@contextmanager
+def _buffered_stdout():
+    """Collect a report section's prints and write them to stdout in one call, even if the section fails"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 class EnhancedAlertAnalyzer:
     def __init__(self, data_folder):
         self.data_folder = data_folder
         self.start_date = "20250830"
         self.alerts_data = []
+        self.cols = {}
+        self.ticker_names = []
+        self.sector_names = []
         self.success_patterns = {
             'flat_to_spike': [],
             'momentum_continuation': [],
@@ -28,227 +111,205 @@ class EnhancedAlertAnalyzer:
         """Load all alert files from the specified date range."""
         print(f"Loading alert files from {self.start_date} onwards...")
         
-        # Get files from both August 30th onwards and September
-        patterns = [
-            f"{self.data_folder}/alerts_{self.start_date}*.json",
-            f"{self.data_folder}/alerts_202509*.json"
-        ]
-        
-        files = []
-        for pattern in patterns:
-            files.extend(glob.glob(pattern))
-        
-        files.sort()
+        # Get files from both August 30th onwards and September, in one directory pass
+        prefixes = (f"alerts_{self.start_date}", "alerts_202509")
+        files = sorted(entry.path for entry in os.scandir(self.data_folder)
+                       if entry.name.startswith(prefixes) and entry.name.endswith('.json'))
         print(f"Found {len(files)} alert files to analyze")
         
         loaded_count = 0
-        for file_path in files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    self.alerts_data.append(data)
-                    loaded_count += 1
-            except Exception as e:
-                print(f"Error loading {file_path}: {e}")
+        # Reads overlap on a thread pool (file I/O and orjson release the GIL); map keeps file order
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for file_path, (data, error) in zip(files, executor.map(_load_alert_file, files)):
+                if error is not None:
+                    print(f"Error loading {file_path}: {error}")
+                    continue
+                self.alerts_data.append(data)
+                loaded_count += 1
                 
         print(f"Successfully loaded {loaded_count} alert files")
+    
+    def _build_columns(self):
+        """
+        Flatten every alert into parallel arrays in a single pass
+        Rows run file by file, and within a file in ALERT_TYPES order, so masks keep each analysis's scan order.
+        Tickers and sectors are stored as codes into self.ticker_names and self.sector_names,
+        numbered in order of first appearance.
+        """
+        rows, atypes = [], []
+        for alert_data in self.alerts_data:
+            for code, alert_type in enumerate(ALERT_TYPES):
+                alert_rows = alert_data[alert_type]
+                rows.extend(alert_rows)
+                atypes.extend([code] * len(alert_rows))
+        
+        tickers, sectors, change_from_open, change_pct, relative_volume = zip(*rows) if rows else ((),) * 5
+        ticker_codes, sector_codes = {}, {}
+        tickers = [ticker_codes.setdefault(ticker, len(ticker_codes)) for ticker in tickers]
+        sectors = [sector_codes.setdefault(sector, len(sector_codes)) for sector in sectors]
+        
+        self.cols = {
+            'ticker': np.array(tickers, dtype=np.int32),
+            'sector': np.array(sectors, dtype=np.int32),
+            'atype': np.array(atypes, dtype=np.int8),
+            'cfo': np.array(change_from_open, dtype=np.float64),
+            'cpct': np.array(change_pct, dtype=np.float64),
+            'relvol': np.array(relative_volume, dtype=np.float64),
+        }
+        self.ticker_names = list(ticker_codes)
+        self.sector_names = list(sector_codes)
+        
+        # The columns hold everything the analyses read, so the per-alert tuples can go
+        self.alerts_data.clear()
+    
+    def _build_masks(self):
+        """Row masks the analyses share, computed once over the columns"""
+        cols = self.cols
+        self.is_fts = cols['cfo'] > 15  # Flat-to-spike threshold
+        self.is_hm = cols['cpct'] > 15  # High momentum threshold
+        self.is_scan = np.isin(cols['atype'], (VOLUME_CLIMBERS, PRICE_SPIKES, PREMARKET_PRICE))
+        self.has_relvol = ~np.isnan(cols['relvol'])
         
     def analyze_flat_to_spike_patterns(self):
         """Analyze flat-to-spike patterns and their characteristics."""
         print("\n=== FLAT-TO-SPIKE PATTERN ANALYSIS ===")
         
-        flat_to_spike_alerts = []
-        regular_spike_alerts = []
+        cols = self.cols
+        cfo = cols['cfo']
+        in_scan = self.is_scan & (cols['atype'] != PREMARKET_PRICE)
+        fts_mask = in_scan & self.is_fts
+        regular_mask = in_scan & (cfo > 0) & ~self.is_fts
+        fts_count = int(fts_mask.sum())
         
-        for alert_data in self.alerts_data:
-            for alert_type in ['volume_climbers', 'price_spikes']:
-                alerts = alert_data.get(alert_type, [])
-                for alert in alerts:
-                    change_from_open = alert.get('change_from_open', 0)
-                    if change_from_open > 15:  # Flat-to-spike threshold
-                        flat_to_spike_alerts.append(alert)
-                    elif change_from_open > 0:
-                        regular_spike_alerts.append(alert)
-        
-        print(f"Flat-to-spike alerts: {len(flat_to_spike_alerts)}")
-        print(f"Regular spike alerts: {len(regular_spike_alerts)}")
-        
-        if flat_to_spike_alerts:
+        print(f"Flat-to-spike alerts: {fts_count}")
+        print(f"Regular spike alerts: {int(regular_mask.sum())}")
+        
+        if fts_count:
             print("\nFlat-to-Spike Characteristics:")
-            avg_change_from_open = statistics.mean([a.get('change_from_open', 0) for a in flat_to_spike_alerts])
-            avg_rel_vol = statistics.mean([a.get('relative_volume', 0) for a in flat_to_spike_alerts if 'relative_volume' in a])
-            avg_price_change = statistics.mean([a.get('change_pct', 0) for a in flat_to_spike_alerts])
+            avg_change_from_open = _mean(cfo[fts_mask])
+            avg_rel_vol = _mean(cols['relvol'][fts_mask & self.has_relvol])
+            avg_price_change = _mean(cols['cpct'][fts_mask])
             
             print(f"  Average change from open: {avg_change_from_open:.2f}%")
             print(f"  Average relative volume: {avg_rel_vol:.2f}x")
             print(f"  Average price change: {avg_price_change:.2f}%")
             
             # Top flat-to-spike performers
-            sorted_fts = sorted(flat_to_spike_alerts, key=lambda x: x.get('change_from_open', 0), reverse=True)
+            fts_rows = np.flatnonzero(fts_mask)
+            top_rows = _top_rows(fts_rows, cfo[fts_rows], 10)
             print(f"\nTop 10 Flat-to-Spike Performers:")
             print(f"{'Ticker':<8} {'Change from Open%':<18} {'Price Change%':<15} {'Rel Vol':<10} {'Sector'}")
             print("-" * 70)
-            for alert in sorted_fts[:10]:
-                ticker = alert.get('ticker', 'N/A')
-                change_from_open = alert.get('change_from_open', 0)
-                change_pct = alert.get('change_pct', 0)
-                rel_vol = alert.get('relative_volume', 0)
-                sector = alert.get('sector', 'Unknown')[:15]
+            for row in top_rows:
+                ticker = self.ticker_names[cols['ticker'][row]] or 'N/A'
+                change_from_open = cfo[row]
+                change_pct = cols['cpct'][row]
+                rel_vol = np.nan_to_num(cols['relvol'][row])
+                sector = self.sector_names[cols['sector'][row]][:15]
                 print(f"{ticker:<8} {change_from_open:<18.2f} {change_pct:<15.2f} {rel_vol:<10.2f} {sector}")
     
     def analyze_premarket_performance(self):
         """Analyze premarket alert performance and follow-through."""
         print("\n=== PREMARKET ALERT PERFORMANCE ===")
         
-        premarket_alerts = {
-            'volume': [],
-            'price': []
-        }
+        cols = self.cols
+        volume_count = int((cols['atype'] == PREMARKET_VOLUME).sum())
+        price_mask = cols['atype'] == PREMARKET_PRICE
+        price_count = int(price_mask.sum())
         
-        for alert_data in self.alerts_data:
-            premarket_alerts['volume'].extend(alert_data.get('premarket_volume_alerts', []))
-            premarket_alerts['price'].extend(alert_data.get('premarket_price_alerts', []))
-            
-        total_premarket = len(premarket_alerts['volume']) + len(premarket_alerts['price'])
+        total_premarket = volume_count + price_count
         print(f"Total premarket alerts: {total_premarket}")
-        print(f"  Volume alerts: {len(premarket_alerts['volume'])} ({len(premarket_alerts['volume'])/total_premarket*100:.1f}%)")
-        print(f"  Price alerts: {len(premarket_alerts['price'])} ({len(premarket_alerts['price'])/total_premarket*100:.1f}%)")
+        print(f"  Volume alerts: {volume_count} ({volume_count/total_premarket*100:.1f}%)")
+        print(f"  Price alerts: {price_count} ({price_count/total_premarket*100:.1f}%)")
         
-        if premarket_alerts['price']:
+        if price_count:
             print("\nPremarket Price Alert Analysis:")
-            avg_change = statistics.mean([a.get('change_pct', 0) for a in premarket_alerts['price']])
-            avg_rel_vol = statistics.mean([a.get('relative_volume', 0) for a in premarket_alerts['price'] if 'relative_volume' in a])
+            avg_change = _mean(cols['cpct'][price_mask])
+            avg_rel_vol = _mean(cols['relvol'][price_mask & self.has_relvol])
             
             print(f"  Average price change: {avg_change:.2f}%")
             print(f"  Average relative volume: {avg_rel_vol:.2f}x")
             
             # High momentum premarket alerts
-            high_momentum = [a for a in premarket_alerts['price'] if a.get('change_pct', 0) > 15]
-            print(f"  High momentum alerts (>15%): {len(high_momentum)} ({len(high_momentum)/len(premarket_alerts['price'])*100:.1f}%)")
+            high_momentum = int((price_mask & self.is_hm).sum())
+            print(f"  High momentum alerts (>15%): {high_momentum} ({high_momentum/price_count*100:.1f}%)")
     
     def analyze_sector_momentum_patterns(self):
         """Analyze momentum patterns by sector."""
         print("\n=== SECTOR MOMENTUM PATTERNS ===")
         
-        sector_momentum = defaultdict(lambda: {
-            'flat_to_spike_count': 0,
-            'regular_alerts': 0,
-            'avg_relative_volume': [],
-            'avg_momentum_score': [],
-            'top_performers': []
-        })
-        
-        for alert_data in self.alerts_data:
-            for alert_type in ['volume_climbers', 'price_spikes', 'premarket_price_alerts']:
-                alerts = alert_data.get(alert_type, [])
-                for alert in alerts:
-                    sector = alert.get('sector', 'Unknown')
-                    change_from_open = alert.get('change_from_open', 0)
-                    
-                    if change_from_open > 15:
-                        sector_momentum[sector]['flat_to_spike_count'] += 1
-                    else:
-                        sector_momentum[sector]['regular_alerts'] += 1
-                    
-                    if 'relative_volume' in alert:
-                        sector_momentum[sector]['avg_relative_volume'].append(alert['relative_volume'])
-                    
-                    # Calculate momentum score
-                    momentum_score = (alert.get('change_pct', 0) * 0.4 + 
-                                    alert.get('relative_volume', 0) * 0.3 + 
-                                    alert.get('change_from_open', 0) * 0.3)
-                    sector_momentum[sector]['avg_momentum_score'].append(momentum_score)
-                    
-                    # Track top performers
-                    if momentum_score > 50:
-                        sector_momentum[sector]['top_performers'].append({
-                            'ticker': alert.get('ticker'),
-                            'momentum_score': momentum_score,
-                            'change_pct': alert.get('change_pct', 0)
-                        })
+        cols = self.cols
+        rows = self.is_scan
+        sectors = cols['sector'][rows]
+        change_from_open = cols['cfo'][rows]
+        rel_vols = cols['relvol'][rows]
+        has_rel_vol = self.has_relvol[rows]
+        sector_count = len(self.sector_names)
+        
+        # Per-sector sums in one bincount each instead of per-alert dict updates
+        momentum_scores = (cols['cpct'][rows] * 0.4 +
+                           np.nan_to_num(rel_vols) * 0.3 +
+                           change_from_open * 0.3)
+        is_fts = self.is_fts[rows]
+        totals = np.bincount(sectors, minlength=sector_count)
+        fts_counts = np.bincount(sectors[is_fts], minlength=sector_count)
+        rel_vol_counts = np.bincount(sectors[has_rel_vol], minlength=sector_count)
+        rel_vol_sums = np.bincount(sectors[has_rel_vol], weights=rel_vols[has_rel_vol], minlength=sector_count)
+        momentum_sums = np.bincount(sectors, weights=momentum_scores, minlength=sector_count)
+        
+        # Most flat-to-spikes first; ties keep the order the sectors were first seen in
+        present, first_seen = np.unique(sectors, return_index=True)
+        present = present[np.lexsort((first_seen, -fts_counts[present]))]
         
         print(f"Sector Momentum Analysis:")
         print(f"{'Sector':<25} {'FTS Count':<10} {'Regular':<8} {'Avg RelVol':<12} {'Momentum Score':<15}")
         print("-" * 80)
         
-        for sector, data in sorted(sector_momentum.items(), 
-                                 key=lambda x: x[1]['flat_to_spike_count'], reverse=True)[:15]:
+        for code in present[:15]:
+            sector = self.sector_names[code]
             if sector is None:
                 sector = "Unknown"
-            avg_rel_vol = statistics.mean(data['avg_relative_volume']) if data['avg_relative_volume'] else 0
-            avg_momentum = statistics.mean(data['avg_momentum_score']) if data['avg_momentum_score'] else 0
+            fts_count = int(fts_counts[code])
+            regular_count = int(totals[code]) - fts_count
+            avg_rel_vol = rel_vol_sums[code] / rel_vol_counts[code] if rel_vol_counts[code] else 0
+            avg_momentum = momentum_sums[code] / totals[code]
             
-            print(f"{sector:<25} {data['flat_to_spike_count']:<10} {data['regular_alerts']:<8} {avg_rel_vol:<12.2f} {avg_momentum:<15.2f}")
+            print(f"{sector:<25} {fts_count:<10} {regular_count:<8} {avg_rel_vol:<12.2f} {avg_momentum:<15.2f}")
     
     def analyze_ticker_success_patterns(self):
         """Analyze individual ticker success patterns."""
         print("\n=== TICKER SUCCESS PATTERNS ===")
         
-        ticker_performance = defaultdict(lambda: {
-            'total_alerts': 0,
-            'flat_to_spike_count': 0,
-            'high_momentum_count': 0,
-            'avg_change_pct': [],
-            'avg_relative_volume': [],
-            'best_performance': 0,
-            'alert_types': set()
-        })
-        
-        for alert_data in self.alerts_data:
-            for alert_type in ['volume_climbers', 'volume_newcomers', 'price_spikes', 
-                             'premarket_volume_alerts', 'premarket_price_alerts']:
-                alerts = alert_data.get(alert_type, [])
-                for alert in alerts:
-                    ticker = alert.get('ticker')
-                    if not ticker:
-                        continue
-                        
-                    perf = ticker_performance[ticker]
-                    perf['total_alerts'] += 1
-                    perf['alert_types'].add(alert_type)
-                    
-                    change_from_open = alert.get('change_from_open', 0)
-                    change_pct = alert.get('change_pct', 0)
-                    
-                    if change_from_open > 15:
-                        perf['flat_to_spike_count'] += 1
-                    
-                    if change_pct > 15:
-                        perf['high_momentum_count'] += 1
-                    
-                    perf['avg_change_pct'].append(change_pct)
-                    if 'relative_volume' in alert:
-                        perf['avg_relative_volume'].append(alert['relative_volume'])
-                    
-                    perf['best_performance'] = max(perf['best_performance'], change_pct)
-        
-        # Find tickers with consistent patterns
-        consistent_performers = []
-        for ticker, perf in ticker_performance.items():
-            if perf['total_alerts'] >= 5:  # At least 5 alerts
-                fts_ratio = perf['flat_to_spike_count'] / perf['total_alerts']
-                high_momentum_ratio = perf['high_momentum_count'] / perf['total_alerts']
-                avg_change = statistics.mean(perf['avg_change_pct']) if perf['avg_change_pct'] else 0
-                
-                if fts_ratio > 0.3 or high_momentum_ratio > 0.4:  # Good success pattern
-                    consistent_performers.append({
-                        'ticker': ticker,
-                        'total_alerts': perf['total_alerts'],
-                        'fts_ratio': fts_ratio,
-                        'high_momentum_ratio': high_momentum_ratio,
-                        'avg_change': avg_change,
-                        'best_performance': perf['best_performance']
-                    })
-        
-        consistent_performers.sort(key=lambda x: x['avg_change'], reverse=True)
+        cols = self.cols
+        named = np.array([bool(ticker) for ticker in self.ticker_names], dtype=bool)
+        has_ticker = named[cols['ticker']]
+        
+        # Sort alerts by ticker code (stable, so each ticker keeps its scan order) and reduce each contiguous run
+        codes = cols['ticker'][has_ticker]
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        change_pct = cols['cpct'][has_ticker][order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        
+        # Codes number tickers by first appearance, so the runs come out in first-seen order for ties below
+        ticker_codes = codes[starts]
+        total_alerts = np.diff(np.r_[starts, len(codes)])
+        fts_ratio = np.add.reduceat(self.is_fts[has_ticker][order].astype(np.int64), starts) / total_alerts
+        high_momentum_ratio = np.add.reduceat(self.is_hm[has_ticker][order].astype(np.int64), starts) / total_alerts
+        avg_change = np.add.reduceat(change_pct, starts) / total_alerts
+        # Best performance is never reported below 0
+        best_performance = np.maximum(np.maximum.reduceat(change_pct, starts), 0)
+        
+        # Find tickers with consistent patterns: at least 5 alerts and a good success pattern
+        consistent = np.flatnonzero((total_alerts >= 5) & ((fts_ratio > 0.3) | (high_momentum_ratio > 0.4)))
         
         print(f"Top Consistent Performers (5+ alerts):")
         print(f"{'Ticker':<8} {'Alerts':<7} {'FTS Ratio':<10} {'HM Ratio':<10} {'Avg Change%':<12} {'Best %':<8}")
         print("-" * 65)
         
-        for perf in consistent_performers[:15]:
-            print(f"{perf['ticker']:<8} {perf['total_alerts']:<7} {perf['fts_ratio']:<10.2f} "
-                  f"{perf['high_momentum_ratio']:<10.2f} {perf['avg_change']:<12.2f} {perf['best_performance']:<8.2f}")
+        for group in _top_rows(consistent, avg_change[consistent], 15):
+            print(f"{self.ticker_names[ticker_codes[group]]:<8} {total_alerts[group]:<7} {fts_ratio[group]:<10.2f} "
+                  f"{high_momentum_ratio[group]:<10.2f} {avg_change[group]:<12.2f} {best_performance[group]:<8.2f}")
     
     def generate_optimization_recommendations(self):
         """Generate specific recommendations for alert optimization."""
@@ -257,28 +318,13 @@ class EnhancedAlertAnalyzer:
         print("="*70)
         
         # Calculate key metrics
-        all_alerts = []
-        flat_to_spike_alerts = []
-        high_momentum_alerts = []
+        cols = self.cols
+        in_scan = self.is_scan
+        fts_mask = in_scan & self.is_fts
         
-        for alert_data in self.alerts_data:
-            for alert_type in ['volume_climbers', 'price_spikes', 'premarket_price_alerts']:
-                alerts = alert_data.get(alert_type, [])
-                for alert in alerts:
-                    all_alerts.append(alert)
-                    
-                    change_from_open = alert.get('change_from_open', 0)
-                    change_pct = alert.get('change_pct', 0)
-                    
-                    if change_from_open > 15:
-                        flat_to_spike_alerts.append(alert)
-                    
-                    if change_pct > 15:
-                        high_momentum_alerts.append(alert)
-        
-        total_alerts = len(all_alerts)
-        fts_count = len(flat_to_spike_alerts)
-        hm_count = len(high_momentum_alerts)
+        total_alerts = int(in_scan.sum())
+        fts_count = int(fts_mask.sum())
+        hm_count = int((in_scan & self.is_hm).sum())
         
         print(f"\n1. SUCCESS PATTERN ANALYSIS:")
         print(f"   • Total analyzed alerts: {total_alerts}")
@@ -286,26 +332,24 @@ class EnhancedAlertAnalyzer:
         print(f"   • High momentum alerts: {hm_count} ({hm_count/total_alerts*100:.1f}%)")
         
         if fts_count > 0:
-            avg_fts_change = statistics.mean([a.get('change_pct', 0) for a in flat_to_spike_alerts])
-            avg_fts_rel_vol = statistics.mean([a.get('relative_volume', 0) for a in flat_to_spike_alerts if 'relative_volume' in a])
+            avg_fts_change = _mean(cols['cpct'][fts_mask])
+            avg_fts_rel_vol = _mean(cols['relvol'][fts_mask & self.has_relvol])
             print(f"   • Avg FTS price change: {avg_fts_change:.2f}%")
             print(f"   • Avg FTS relative volume: {avg_fts_rel_vol:.2f}x")
         
         print(f"\n2. THRESHOLD OPTIMIZATION:")
-        if all_alerts:
-            rel_vols = [a.get('relative_volume', 0) for a in all_alerts if 'relative_volume' in a]
-            price_changes = [a.get('change_pct', 0) for a in all_alerts]
+        if total_alerts:
+            rel_vols = cols['relvol'][in_scan & self.has_relvol]
+            price_changes = cols['cpct'][in_scan]
             
-            if rel_vols:
-                p75_rel_vol = sorted(rel_vols)[int(len(rel_vols) * 0.75)]
-                p90_rel_vol = sorted(rel_vols)[int(len(rel_vols) * 0.9)]
+            if rel_vols.size:
+                p75_rel_vol, p90_rel_vol = _rank_percentiles(rel_vols, (0.75, 0.9))
                 print(f"   → 75th percentile relative volume: {p75_rel_vol:.2f}x")
                 print(f"   → 90th percentile relative volume: {p90_rel_vol:.2f}x")
                 print(f"   → RECOMMENDATION: Set high-quality threshold at {p75_rel_vol:.1f}x+")
             
-            if price_changes:
-                p75_price = sorted(price_changes)[int(len(price_changes) * 0.75)]
-                p90_price = sorted(price_changes)[int(len(price_changes) * 0.9)]
+            if price_changes.size:
+                p75_price, p90_price = _rank_percentiles(price_changes, (0.75, 0.9))
                 print(f"   → 75th percentile price change: {p75_price:.2f}%")
                 print(f"   → 90th percentile price change: {p90_price:.2f}%")
                 print(f"   → RECOMMENDATION: Set immediate alert threshold at {p90_price:.1f}%+")
@@ -314,8 +358,7 @@ class EnhancedAlertAnalyzer:
         print(f"   → FLAT-TO-SPIKE DETECTION:")
         print(f"     • Current threshold: 15% change from open")
         if fts_count > 0:
-            fts_changes = [a.get('change_from_open', 0) for a in flat_to_spike_alerts]
-            min_fts_change = min(fts_changes)
+            min_fts_change = cols['cfo'][fts_mask].min()
             print(f"     • Minimum detected FTS: {min_fts_change:.2f}%")
             print(f"     • RECOMMENDATION: Consider lowering to {min_fts_change*0.8:.1f}% for earlier detection")
         
@@ -346,12 +389,17 @@ class EnhancedAlertAnalyzer:
         if not self.alerts_data:
             print("No alert data found for analysis.")
             return
-            
-        self.analyze_flat_to_spike_patterns()
-        self.analyze_premarket_performance()
-        self.analyze_sector_momentum_patterns()
-        self.analyze_ticker_success_patterns()
-        self.generate_optimization_recommendations()
+        
+        self._build_columns()
+        self._build_masks()
+        # Each section prints dozens of table rows; buffer them so a section costs one write
+        for analysis in (self.analyze_flat_to_spike_patterns,
+                         self.analyze_premarket_performance,
+                         self.analyze_sector_momentum_patterns,
+                         self.analyze_ticker_success_patterns,
+                         self.generate_optimization_recommendations):
+            with _buffered_stdout():
+                analysis()
         
         print(f"\n" + "="*60)
         print("Enhanced analysis completed successfully!")
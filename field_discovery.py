@@ -3,19 +3,43 @@
 Simple script to discover correct TradingView field names
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import rookiepy
 from tradingview_screener import Query
 
+def _probe_category(candidates, cookies):
+    """Try a category's candidates in order until one works; returns (working field or None, log lines)"""
+    log = []
+    for field in candidates:
+        try:
+            test_query = Query().select('name', field).limit(1)
+            result = test_query.get_scanner_data(cookies=cookies)
+            
+            if isinstance(result, tuple) and len(result) == 2:
+                _, df = result
+                if hasattr(df, 'columns') and field in df.columns:
+                    log.append(f"✅ {field} - WORKS")
+                    return field, log  # Found working field for this category
+                else:
+                    log.append(f"❌ {field} - Not in columns")
+            else:
+                log.append(f"❌ {field} - Unexpected result format")
+                
+        except Exception as e:
+            log.append(f"❌ {field} - Error: {str(e)[:50]}...")
+    return None, log
+
 def test_field_names():
     """Test different field name possibilities"""
     
     # Get cookies
     try:
         cookies_list = rookiepy.load()
-        cookies = {}
-        for cookie in cookies_list:
-            if 'tradingview.com' in cookie.get('domain', ''):
-                cookies[cookie['name']] = cookie['value']
+        # Only tradingview.com itself or its subdomains; a bare suffix test would also match e.g. eviltradingview.com
+        cookies = {cookie['name']: cookie['value'] for cookie in cookies_list
+                   if cookie.get('domain', '').lstrip('.') == 'tradingview.com'
+                   or cookie.get('domain', '').endswith('.tradingview.com')}
         print(f"Loaded {len(cookies)} cookies")
     except Exception as e:
         print(f"Cookie error: {e}")
@@ -69,26 +93,15 @@ def test_field_names():
     
     working_fields = ['name', 'volume', 'close', 'change', 'sector', 'exchange']  # Known working fields
     
-    for category, candidates in field_candidates.items():
-        print(f"\n--- Testing {category} ---")
-        for field in candidates:
-            try:
-                test_query = Query().select('name', field).limit(1)
-                result = test_query.get_scanner_data(cookies=cookies)
-                
-                if isinstance(result, tuple) and len(result) == 2:
-                    _, df = result
-                    if hasattr(df, 'columns') and field in df.columns:
-                        print(f"✅ {field} - WORKS")
-                        working_fields.append(field)
-                        break  # Found working field for this category
-                    else:
-                        print(f"❌ {field} - Not in columns")
-                else:
-                    print(f"❌ {field} - Unexpected result format")
-                    
-            except Exception as e:
-                print(f"❌ {field} - Error: {str(e)[:50]}...")
+    # Categories are probed concurrently (each is a chain of HTTPS round trips); map keeps their order for the log
+    with ThreadPoolExecutor(max_workers=len(field_candidates)) as executor:
+        probes = executor.map(lambda candidates: _probe_category(candidates, cookies), field_candidates.values())
+        for category, (field, log) in zip(field_candidates, probes):
+            print(f"\n--- Testing {category} ---")
+            for line in log:
+                print(line)
+            if field:
+                working_fields.append(field)
     
     print(f"\n=== WORKING FIELDS ===")
     for field in working_fields:
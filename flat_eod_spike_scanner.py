@@ -12,8 +12,18 @@ import numpy as np
 from typing import List, Dict, Tuple
 import argparse
 
+from data_utils import PriceCache
+
+# Tickers per yf.download request, keeping the query URL within Yahoo's limit
+BATCH_SIZE = 20
+
+# Each ticker's 5-minute bars for the scanned window, as downloaded here
+PRICE_CACHE = PriceCache('flat_eod_spike_scanner')
+
 
 class FlatEODSpikeScanner:
+    __slots__ = ('flat_threshold_pct', 'eod_spike_threshold_pct', 'eod_window_minutes')
+
     def __init__(self,
                  flat_threshold_pct: float = 2.0,
                  eod_spike_threshold_pct: float = 5.0,
@@ -30,73 +40,62 @@ class FlatEODSpikeScanner:
         self.eod_spike_threshold_pct = eod_spike_threshold_pct
         self.eod_window_minutes = eod_window_minutes
 
-    def calculate_intraday_range(self, df: pd.DataFrame, exclude_eod_minutes: int) -> float:
+    def calculate_intraday_range(self, high: np.ndarray, low: np.ndarray, day_starts: np.ndarray,
+                                 exclude_eod_minutes: int) -> np.ndarray:
         """
-        Calculate the price range % for the day excluding EOD period.
+        Calculate the price range % for each day excluding EOD period.
 
         Args:
-            df: DataFrame with 5-minute data
+            high: High of every 5-minute bar, in time order
+            low: Low of every 5-minute bar, in time order
+            day_starts: Index of each day's first bar
             exclude_eod_minutes: Minutes at end of day to exclude
 
         Returns:
-            Range percentage
+            Range percentage per day (0 when the excluded period covers the whole day)
         """
-        if len(df) == 0:
-            return 0.0
+        bars = np.diff(np.append(day_starts, len(high)))
 
-        # Exclude the last N minutes
+        # Exclude the last N minutes by masking each day's trailing bars
         bars_to_exclude = exclude_eod_minutes // 5
-        if bars_to_exclude >= len(df):
-            return 0.0
-
-        df_body = df.iloc[:-bars_to_exclude] if bars_to_exclude > 0 else df
-
-        if len(df_body) == 0:
-            return 0.0
-
-        high = df_body['High'].max()
-        low = df_body['Low'].min()
-        avg_price = (high + low) / 2
-
-        if avg_price == 0:
-            return 0.0
-
-        range_pct = ((high - low) / avg_price) * 100
-        return range_pct
-
-    def calculate_eod_spike(self, df: pd.DataFrame, window_minutes: int) -> Tuple[float, float, float]:
+        bar_day = np.repeat(np.arange(len(day_starts)), bars)
+        in_body = np.arange(len(high)) - day_starts[bar_day] < (bars - bars_to_exclude)[bar_day]
+
+        body_high = np.fmax.reduceat(np.where(in_body, high, -np.inf), day_starts)
+        body_low = np.fmin.reduceat(np.where(in_body, low, np.inf), day_starts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_price = (body_high + body_low) / 2
+            range_pct = ((body_high - body_low) / avg_price) * 100
+        return np.where((bars_to_exclude >= bars) | (avg_price == 0), 0.0, range_pct)
+
+    def calculate_eod_spike(self, opens: np.ndarray, closes: np.ndarray, day_starts: np.ndarray,
+                            window_minutes: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate the price movement in the EOD window.
+        Calculate the price movement in each day's EOD window.
 
         Args:
-            df: DataFrame with 5-minute data
+            opens: Open of every 5-minute bar, in time order
+            closes: Close of every 5-minute bar, in time order
+            day_starts: Index of each day's first bar
             window_minutes: Number of minutes at end of day to analyze
 
         Returns:
-            Tuple of (spike_pct, eod_start_price, eod_end_price)
+            Tuple of per-day arrays (spike_pct, eod_start_price, eod_end_price)
         """
-        if len(df) == 0:
-            return 0.0, 0.0, 0.0
+        day_ends = np.append(day_starts[1:], len(opens))
+        bars = day_ends - day_starts
 
+        # A window longer than the day, or shorter than one bar, covers the whole day
         bars_in_window = window_minutes // 5
-        if bars_in_window >= len(df):
-            bars_in_window = len(df)
-
-        eod_data = df.iloc[-bars_in_window:]
+        bars_in_window = np.where((bars_in_window >= bars) | (bars_in_window == 0), bars, bars_in_window)
 
-        if len(eod_data) == 0:
-            return 0.0, 0.0, 0.0
+        # Starting price is the open of the window's first bar, ending price the close of the last bar
+        eod_start_price = opens[day_ends - bars_in_window]
+        eod_end_price = closes[day_ends - 1]
 
-        # Get the starting price (open of first bar in window)
-        eod_start_price = eod_data.iloc[0]['Open']
-
-        # Get the ending price (close of last bar)
-        eod_end_price = eod_data.iloc[-1]['Close']
-
-        if eod_start_price == 0:
-            return 0.0, eod_start_price, eod_end_price
-
-        spike_pct = ((eod_end_price - eod_start_price) / eod_start_price) * 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spike_pct = ((eod_end_price - eod_start_price) / eod_start_price) * 100
+        spike_pct = np.where(eod_start_price == 0, 0.0, spike_pct)
 
         return spike_pct, eod_start_price, eod_end_price
 
@@ -109,64 +108,130 @@ class FlatEODSpikeScanner:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
 
+        Returns:
+            List of pattern matches with details
+        """
+        df = PRICE_CACHE.load(ticker, start_date, end_date, '5m')
+
+        if df is None:
+            try:
+                # Download 5-minute data
+                stock = yf.Ticker(ticker)
+                df = stock.history(start=start_date, end=end_date, interval='5m')
+            except Exception as e:
+                print(f"  ❌ Error scanning {ticker}: {str(e)}")
+                return []
+
+            if not df.empty:
+                PRICE_CACHE.store(ticker, start_date, end_date, '5m', df)
+
+        return self.scan_ticker_for_pattern_from_df(ticker, df)
+
+    def scan_ticker_for_pattern_from_df(self, ticker: str, df: pd.DataFrame) -> List[Dict]:
+        """
+        Scan already downloaded 5-minute data for flat-to-EOD-spike pattern.
+
+        Args:
+            ticker: Stock ticker symbol
+            df: DataFrame with the ticker's 5-minute data
+
         Returns:
             List of pattern matches with details
         """
         matches = []
 
         try:
-            # Download 5-minute data
-            stock = yf.Ticker(ticker)
-            df = stock.history(start=start_date, end=end_date, interval='5m')
-
             if df.empty:
                 print(f"  ⚠️  No data for {ticker}")
                 return matches
 
-            # Group by date
-            df['Date'] = df.index.date
-
-            for date, day_data in df.groupby('Date'):
-                # Need at least some bars to analyze
-                if len(day_data) < 10:
-                    continue
-
-                # Calculate intraday range excluding EOD window
-                intraday_range_pct = self.calculate_intraday_range(
-                    day_data,
-                    self.eod_window_minutes
-                )
-
-                # Calculate EOD spike
-                eod_spike_pct, eod_start, eod_end = self.calculate_eod_spike(
-                    day_data,
-                    self.eod_window_minutes
-                )
-
-                # Check if pattern matches
-                is_flat = intraday_range_pct <= self.flat_threshold_pct
-                has_eod_spike = eod_spike_pct >= self.eod_spike_threshold_pct
-
-                if is_flat and has_eod_spike:
-                    matches.append({
-                        'ticker': ticker,
-                        'date': str(date),
-                        'intraday_range_pct': round(intraday_range_pct, 2),
-                        'eod_spike_pct': round(eod_spike_pct, 2),
-                        'eod_start_price': round(eod_start, 2),
-                        'eod_end_price': round(eod_end, 2),
-                        'day_open': round(day_data.iloc[0]['Open'], 2),
-                        'day_high': round(day_data['High'].max(), 2),
-                        'day_low': round(day_data['Low'].min(), 2),
-                        'day_close': round(day_data.iloc[-1]['Close'], 2),
-                        'volume': int(day_data['Volume'].sum())
-                    })
+            high = df['High'].to_numpy()
+            low = df['Low'].to_numpy()
+            opens = df['Open'].to_numpy()
+            closes = df['Close'].to_numpy()
+            volume = df['Volume'].to_numpy()
+
+            # Rows are in time order, so each date's bars form one contiguous run starting where the day changes.
+            # Days are keyed on the local wall-clock date, as datetime64 rather than Python date objects.
+            local_index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+            day_keys = local_index.to_numpy().astype('datetime64[D]')
+            day_starts = np.flatnonzero(np.r_[True, day_keys[1:] != day_keys[:-1]])
+            day_ends = np.append(day_starts[1:], len(df))
+            dates = day_keys[day_starts]
+
+            # Calculate EOD spike
+            eod_spike_pct, eod_start, eod_end = self.calculate_eod_spike(
+                opens, closes, day_starts, self.eod_window_minutes)
+
+            # Only days with enough bars to analyze and an EOD spike can match. The spike is two lookups per day,
+            # so it rejects most days before any of their bars are scanned for the intraday range.
+            bars = day_ends - day_starts
+            is_candidate = (bars >= 10) & (eod_spike_pct >= self.eod_spike_threshold_pct)
+
+            # Calculate intraday range excluding EOD window, over the candidate days' bars only
+            intraday_range_pct = np.full(len(day_starts), np.inf)
+            if is_candidate.any():
+                candidate_bars = np.repeat(is_candidate, bars)
+                candidate_starts = np.append(0, np.cumsum(bars[is_candidate])[:-1])
+                intraday_range_pct[is_candidate] = self.calculate_intraday_range(
+                    high[candidate_bars], low[candidate_bars], candidate_starts, self.eod_window_minutes)
+
+            # Check which days match
+            is_match = is_candidate & (intraday_range_pct <= self.flat_threshold_pct)
+
+            # Day stats come from one reduction per column, shared by every match
+            day_high = np.fmax.reduceat(high, day_starts)
+            day_low = np.fmin.reduceat(low, day_starts)
+            day_volume = np.add.reduceat(np.nan_to_num(volume), day_starts)
+
+            for day in np.flatnonzero(is_match):
+                matches.append({
+                    'ticker': ticker,
+                    'date': str(dates[day]),
+                    'intraday_range_pct': round(intraday_range_pct[day], 2),
+                    'eod_spike_pct': round(eod_spike_pct[day], 2),
+                    'eod_start_price': round(eod_start[day], 2),
+                    'eod_end_price': round(eod_end[day], 2),
+                    'day_open': round(opens[day_starts[day]], 2),
+                    'day_high': round(day_high[day], 2),
+                    'day_low': round(day_low[day], 2),
+                    'day_close': round(eod_end[day], 2),
+                    'volume': int(day_volume[day])
+                })
 
         except Exception as e:
             print(f"  ❌ Error scanning {ticker}: {str(e)}")
 
         return matches
 
+    def _download_batch(self, tickers: List[str], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
+        """
+        Download 5-minute data for several tickers in one request.
+
+        Args:
+            tickers: List of ticker symbols (at most BATCH_SIZE)
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary mapping tickers to their 5-minute data; tickers without data are left out
+        """
+        try:
+            df = yf.download(tickers, start=start_date, end=end_date, interval='5m',
+                             group_by='ticker', threads=True, progress=False)
+        except Exception as e:
+            print(f"  ❌ Error downloading {', '.join(tickers)}: {str(e)}")
+            return {}
+
+        if df.empty:
+            return {}
+
+        if not isinstance(df.columns, pd.MultiIndex):
+            return {tickers[0]: df}
+
+        # The batch shares one index, so drop the rows that only belong to other tickers
+        return {ticker: df[ticker].dropna(how='all') for ticker in df.columns.get_level_values(0).unique()}
+
     def scan_multiple_tickers(self,
                             tickers: List[str],
                             start_date: str,
@@ -186,19 +251,37 @@ class FlatEODSpikeScanner:
         """
         all_results = {}
 
-        for ticker in tickers:
-            if verbose:
-                print(f"\n📊 Scanning {ticker}...")
+        for batch_start in range(0, len(tickers), BATCH_SIZE):
+            batch = tickers[batch_start:batch_start + BATCH_SIZE]
+
+            # Only tickers without cached bars for this window are downloaded
+            batch_data = {}
+            for ticker in batch:
+                cached = PRICE_CACHE.load(ticker, start_date, end_date, '5m')
+                if cached is not None:
+                    batch_data[ticker] = cached
+
+            to_download = [ticker for ticker in batch if ticker not in batch_data]
+            if to_download:
+                for ticker, df in self._download_batch(to_download, start_date, end_date).items():
+                    # A failed ticker comes back as an empty frame; caching it would report no data for good
+                    if not df.empty:
+                        PRICE_CACHE.store(ticker, start_date, end_date, '5m', df)
+                    batch_data[ticker] = df
+
+            for ticker in batch:
+                if verbose:
+                    print(f"\n📊 Scanning {ticker}...")
 
-            matches = self.scan_ticker_for_pattern(ticker, start_date, end_date)
+                matches = self.scan_ticker_for_pattern_from_df(ticker, batch_data.get(ticker, pd.DataFrame()))
 
-            if matches:
-                all_results[ticker] = matches
-                if verbose:
-                    print(f"  ✅ Found {len(matches)} pattern match(es)")
-            else:
-                if verbose:
-                    print(f"  ❌ No patterns found")
+                if matches:
+                    all_results[ticker] = matches
+                    if verbose:
+                        print(f"  ✅ Found {len(matches)} pattern match(es)")
+                else:
+                    if verbose:
+                        print(f"  ❌ No patterns found")
 
         return all_results
 
@@ -6,9 +6,28 @@ Analyzes whether sudden spikes after flat periods are more successful than other
 
 import json
 from pathlib import Path
-from collections import defaultdict
-from datetime import datetime, timedelta
-import statistics
+
+import numpy as np
+import pandas as pd
+
+PREMARKET_ALERT_TYPES = ('premarket_price', 'premarket_volume')
+# Lower edges of the small (25-75%), medium (75-150%) and large (150%+) change buckets
+MAGNITUDE_EDGES = (25, 75, 150)
+# Time periods by hour (EST): before 4 AM, premarket 4-9 AM, the first hour, regular hours, the close hour;
+# np.digitize over the edges gives 0-5, and 5 (after 4 PM) wraps back to after_hours
+TIME_PERIODS = ('after_hours', 'premarket', 'market_open', 'regular_hours', 'market_close')
+TIME_PERIOD_EDGES = (4, 9, 10, 15, 16)
+# A trailing UTC offset on a timestamp string
+UTC_OFFSET_PATTERN = r'(?<=\d)(?:Z|[+-]\d{2}:\d{2})$'
+
+def _first_seen_order(categories):
+    """
+    The non-empty (name, mask) categories as {name: rows}
+    Categories are ordered by their first row, as a defaultdict filled row by row would be.
+    """
+    rows = {name: np.flatnonzero(mask) for name, mask in categories}
+    return dict(sorted(((name, category_rows) for name, category_rows in rows.items() if category_rows.size),
+                       key=lambda item: item[1][0]))
 
 class FlatSpikeAnalyzer:
     def __init__(self, results_file="momentum_data/validation_results.json"):
@@ -23,157 +42,99 @@ class FlatSpikeAnalyzer:
         self.all_results = data['results']
         self.successful_tickers = data['successful_tickers']
         self.failed_tickers = data['failed_tickers']
+        self._build_columns()
         
         print(f"Loaded {len(self.successful_tickers)} successful and {len(self.failed_tickers)} failed tickers")
     
+    def _build_columns(self):
+        """
+        Lay out the fields the analyses read as parallel arrays, one row per ticker in results order
+        Each analysis then categorizes every row at once with masks instead of looping over the results.
+        """
+        results = list(self.all_results.values())
+        count = len(results)
+        
+        self.tickers = list(self.all_results)
+        self.success = np.fromiter((data['success'] for data in results), dtype=bool, count=count)
+        self.change_pct = np.fromiter((data['change_pct'] for data in results), dtype=np.float64, count=count)
+        self.max_gain = np.fromiter((data.get('max_gain', 0) for data in results), dtype=np.float64, count=count)
+        self.premarket_change = np.fromiter((data.get('alert_data', {}).get('premarket_change', 0) or 0
+                                             for data in results), dtype=np.float64, count=count)
+        self.is_premarket = np.fromiter((data['alert_type'] in PREMARKET_ALERT_TYPES for data in results),
+                                        dtype=bool, count=count)
+        
+        # Hour of day of each first alert as written (dropping any offset keeps it from being shifted to UTC),
+        # -1 where the timestamp is missing or doesn't parse
+        first_seen = pd.Series([data.get('first_seen') for data in results], dtype=object)
+        first_seen = first_seen.str.replace(UTC_OFFSET_PATTERN, '', regex=True)
+        hours = pd.to_datetime(first_seen, format='ISO8601', errors='coerce').dt.hour
+        self.hours = hours.fillna(-1).to_numpy(dtype=np.int8)
+        
+        # -1 below 25%, then 0 (small), 1 (medium) or 2 (large)
+        self.magnitude = np.digitize(self.change_pct, MAGNITUDE_EDGES) - 1
+    
     def analyze_premarket_vs_intraday_patterns(self):
         """Analyze if premarket gap vs intraday spike patterns differ in success"""
-        premarket_patterns = defaultdict(list)
-        intraday_patterns = defaultdict(list)
-        
-        for ticker, data in self.all_results.items():
-            alert_type = data['alert_type']
-            success = data['success']
-            change_pct = data['change_pct']
-            
-            # Categorize based on alert type and premarket presence
-            alert_data = data.get('alert_data', {})
-            premarket_change = alert_data.get('premarket_change', 0)
-            
-            if alert_type in ['premarket_price', 'premarket_volume']:
-                # This had premarket activity
-                if premarket_change > 0:
-                    category = "premarket_gap_up"
-                else:
-                    category = "premarket_other"
-                premarket_patterns[category].append({
-                    'ticker': ticker,
-                    'success': success,
-                    'change_pct': change_pct,
-                    'premarket_change': premarket_change
-                })
-            else:
-                # This is likely an intraday spike (price_spike type)
-                # Assume sudden spike if no premarket change mentioned
-                if premarket_change == 0 or premarket_change is None:
-                    category = "sudden_intraday_spike"
-                else:
-                    category = "intraday_after_premarket"
-                
-                intraday_patterns[category].append({
-                    'ticker': ticker,
-                    'success': success,
-                    'change_pct': change_pct,
-                    'premarket_change': premarket_change
-                })
+        # Premarket alert types had premarket activity; the rest are likely intraday spikes (price_spike type),
+        # assumed sudden if no premarket change is mentioned
+        gap_up = self.premarket_change > 0
+        no_premarket_change = self.premarket_change == 0
+        
+        premarket_patterns = _first_seen_order((
+            ('premarket_gap_up', self.is_premarket & gap_up),
+            ('premarket_other', self.is_premarket & ~gap_up)))
+        intraday_patterns = _first_seen_order((
+            ('sudden_intraday_spike', ~self.is_premarket & no_premarket_change),
+            ('intraday_after_premarket', ~self.is_premarket & ~no_premarket_change)))
         
         return premarket_patterns, intraday_patterns
     
     def analyze_timing_patterns(self):
         """Analyze timing of successful alerts to detect flat-to-spike patterns"""
-        timing_analysis = defaultdict(list)
-        
-        for ticker, data in self.all_results.items():
-            # Parse timestamp to get time of day
-            try:
-                timestamp_str = data['first_seen']
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                hour = timestamp.hour
-                minute = timestamp.minute
-                
-                # Categorize by time periods
-                if 4 <= hour < 9:  # Premarket hours (4 AM - 9 AM EST)
-                    time_category = "premarket"
-                elif 9 <= hour < 10:  # Market open first hour
-                    time_category = "market_open"
-                elif 10 <= hour < 15:  # Regular trading hours
-                    time_category = "regular_hours"
-                elif 15 <= hour < 16:  # Market close hour
-                    time_category = "market_close"
-                else:  # After hours
-                    time_category = "after_hours"
-                
-                timing_analysis[time_category].append({
-                    'ticker': ticker,
-                    'success': data['success'],
-                    'change_pct': data['change_pct'],
-                    'hour': hour,
-                    'minute': minute,
-                    'alert_type': data['alert_type']
-                })
-                
-            except Exception as e:
-                continue
-        
-        return timing_analysis
+        period = np.digitize(self.hours, TIME_PERIOD_EDGES) % len(TIME_PERIODS)
+        parsed = self.hours >= 0
+        
+        # Categorize by time periods; alerts whose timestamp didn't parse are left out
+        return _first_seen_order((time_period, parsed & (period == code))
+                                 for code, time_period in enumerate(TIME_PERIODS))
     
     def analyze_spike_magnitude_patterns(self):
         """Analyze if smaller sudden spikes are more successful than large premarket gaps"""
+        magnitude = self.magnitude
+        is_sudden = ~self.is_premarket
         
-        patterns = {
-            'small_sudden_spikes': [],      # 25-75% sudden spikes
-            'medium_sudden_spikes': [],     # 75-150% sudden spikes  
-            'large_sudden_spikes': [],      # 150%+ sudden spikes
-            'small_premarket_gaps': [],     # 25-75% premarket gaps
-            'medium_premarket_gaps': [],    # 75-150% premarket gaps
-            'large_premarket_gaps': []      # 150%+ premarket gaps
+        return {
+            'small_sudden_spikes': np.flatnonzero(is_sudden & (magnitude == 0)),               # 25-75% sudden spikes
+            'medium_sudden_spikes': np.flatnonzero(is_sudden & (magnitude == 1)),              # 75-150% sudden spikes
+            'large_sudden_spikes': np.flatnonzero(is_sudden & (magnitude == 2)),               # 150%+ sudden spikes
+            'small_premarket_gaps': np.flatnonzero(self.is_premarket & (magnitude == 0)),      # 25-75% premarket gaps
+            'medium_premarket_gaps': np.flatnonzero(self.is_premarket & (magnitude == 1)),     # 75-150% premarket gaps
+            'large_premarket_gaps': np.flatnonzero(self.is_premarket & (magnitude == 2))       # 150%+ premarket gaps
         }
-        
-        for ticker, data in self.all_results.items():
-            change_pct = data['change_pct']
-            alert_type = data['alert_type']
-            success = data['success']
-            alert_data = data.get('alert_data', {})
-            premarket_change = alert_data.get('premarket_change', 0)
-            
-            entry = {
-                'ticker': ticker,
-                'success': success,
-                'change_pct': change_pct,
-                'max_gain': data.get('max_gain', 0)
-            }
-            
-            # Determine if this is a sudden spike or premarket gap
-            is_premarket = alert_type in ['premarket_price', 'premarket_volume']
-            
-            # Categorize by magnitude and type
-            if 25 <= change_pct < 75:
-                if is_premarket:
-                    patterns['small_premarket_gaps'].append(entry)
-                else:
-                    patterns['small_sudden_spikes'].append(entry)
-            elif 75 <= change_pct < 150:
-                if is_premarket:
-                    patterns['medium_premarket_gaps'].append(entry)
-                else:
-                    patterns['medium_sudden_spikes'].append(entry)
-            elif change_pct >= 150:
-                if is_premarket:
-                    patterns['large_premarket_gaps'].append(entry)
-                else:
-                    patterns['large_sudden_spikes'].append(entry)
-        
-        return patterns
     
-    def calculate_success_metrics(self, data_list):
-        """Calculate success rate and other metrics for a list of alerts"""
-        if not data_list:
+    def calculate_success_metrics(self, rows, keep_samples=5):
+        """
+        Calculate success rate and other metrics for a set of alerts, given as row indices
+        Only the first keep_samples successful tickers are kept, as the report shows no more than that.
+        """
+        if not len(rows):
             return {'count': 0, 'success_rate': 0, 'avg_change': 0, 'avg_max_gain': 0}
         
-        successful = [item for item in data_list if item['success']]
-        success_rate = len(successful) / len(data_list) * 100
+        successful = rows[self.success[rows]]
+        success_rate = len(successful) / len(rows) * 100
         
-        avg_change = statistics.mean([item['change_pct'] for item in data_list])
-        successful_gains = [item.get('max_gain', 0) for item in successful if item.get('max_gain', 0) > 0]
-        avg_max_gain = statistics.mean(successful_gains) if successful_gains else 0
+        avg_change = self.change_pct[rows].mean()
+        successful_gains = self.max_gain[successful]
+        successful_gains = successful_gains[successful_gains > 0]
+        avg_max_gain = successful_gains.mean() if successful_gains.size else 0
         
         return {
-            'count': len(data_list),
+            'count': len(rows),
             'success_count': len(successful),
             'success_rate': success_rate,
             'avg_change': avg_change,
             'avg_max_gain': avg_max_gain,
-            'successful_tickers': [item['ticker'] for item in successful]
+            'successful_tickers': [self.tickers[row] for row in successful[:keep_samples]]
         }
     
     def generate_comprehensive_report(self):
@@ -258,8 +219,11 @@ class FlatSpikeAnalyzer:
         print(f"   Success rate: {best_pattern[1]['success_rate']:.1f}% ({best_pattern[1]['success_count']}/{best_pattern[1]['count']})")
         
         # Compare sudden spikes vs premarket gaps overall
-        sudden_spikes = magnitude_patterns['small_sudden_spikes'] + magnitude_patterns['medium_sudden_spikes'] + magnitude_patterns['large_sudden_spikes']
-        premarket_gaps = magnitude_patterns['small_premarket_gaps'] + magnitude_patterns['medium_premarket_gaps'] + magnitude_patterns['large_premarket_gaps']
+        # (every bucketed alert, with sudden spikes ordered small to large for the sample below)
+        bucketed = self.magnitude >= 0
+        sudden_spikes = np.flatnonzero(bucketed & ~self.is_premarket)
+        sudden_spikes = sudden_spikes[np.argsort(self.magnitude[sudden_spikes], kind='stable')]
+        premarket_gaps = np.flatnonzero(bucketed & self.is_premarket)
         
         sudden_metrics = self.calculate_success_metrics(sudden_spikes)
         premarket_metrics = self.calculate_success_metrics(premarket_gaps)
@@ -278,8 +242,7 @@ class FlatSpikeAnalyzer:
         # 3. Sample successful sudden spikes
         if sudden_metrics['successful_tickers']:
             print(f"\n3. Sample successful sudden spike tickers:")
-            sample_tickers = sudden_metrics['successful_tickers'][:5]
-            for ticker in sample_tickers:
+            for ticker in sudden_metrics['successful_tickers']:
                 ticker_data = self.all_results[ticker]
                 print(f"   {ticker}: {ticker_data['change_pct']:.1f}% initial → {ticker_data.get('max_gain', 0):.1f}% max gain")
         
@@ -4,40 +4,84 @@ List all successful alerts with dates and tickers
 """
 
 import json
-import yfinance as yf
+import mmap
+import os
 from datetime import datetime, timedelta
 
-def get_price_performance(ticker, alert_date, alert_price):
-    """Get the price performance after an alert"""
-    try:
-        # Get data for 5 days after alert
-        end_date = alert_date + timedelta(days=5)
-        data = yf.download(ticker, start=alert_date, end=end_date, progress=False, interval='1d')
+import pandas as pd
+import yfinance as yf
+
+from data_utils import PriceCache, seek_log_date
 
-        if data.empty:
-            return None, None
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-        # Get high price in the 5 days after alert
-        max_price = data['High'].max()
-        max_gain_pct = ((max_price - alert_price) / alert_price) * 100
+# Tickers per yf.download request, keeping the query URL within Yahoo's limit
+BATCH_SIZE = 20
+# Worker threads fetching a batch's tickers concurrently
+DOWNLOAD_THREADS = 8
 
-        return max_price, max_gain_pct
+# Each ticker's 5-day alert window, as downloaded here
+PRICE_CACHE = PriceCache('list_successful_alerts')
+
+def download_daily_prices(tickers, start_date, end_date):
+    """Download daily data for a batch of tickers in one request, as {ticker: DataFrame}"""
+    try:
+        data = yf.download(tickers, start=start_date, end=end_date, progress=False, interval='1d',
+                           group_by='ticker', threads=DOWNLOAD_THREADS)
     except Exception as e:
+        return {}
+
+    if data.empty:
+        return {}
+
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {tickers[0]: data}
+
+    # The batch shares one index, so drop the rows that only belong to other tickers
+    return {ticker: data[ticker].dropna(how='all') for ticker in data.columns.get_level_values(0).unique()}
+
+def alert_window(data, alert_date):
+    """A ticker's daily data for the 5 days after an alert"""
+    end_date = alert_date + timedelta(days=5)
+    return data.loc[alert_date.isoformat():(end_date - timedelta(days=1)).isoformat()]
+
+def get_price_performance(data, alert_date, alert_price):
+    """Get the price performance after an alert from the ticker's daily data"""
+    # Get data for 5 days after alert
+    data = alert_window(data, alert_date)
+
+    if data.empty:
         return None, None
 
+    # Get high price in the 5 days after alert
+    max_price = data['High'].max()
+    max_gain_pct = ((max_price - alert_price) / alert_price) * 100
+
+    return max_price, max_gain_pct
+
 # Load alerts from last 2 weeks
 two_weeks_ago = datetime.now() - timedelta(days=14)
 alerts = []
+alerts_log = 'momentum_data/telegram_alerts_sent.jsonl'
 
-with open('momentum_data/telegram_alerts_sent.jsonl', 'r') as f:
-    for line in f:
-        if line.strip():
-            alert = json.loads(line)
-            alert_time = datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00'))
+# mmap can't map an empty file, and an empty log has no alerts anyway
+if os.path.getsize(alerts_log):
+    with open(alerts_log, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+        # Jump to the first line dated in the window instead of reading the whole history
+        log.seek(seek_log_date(log, two_weeks_ago.strftime('%Y-%m-%d').encode()))
 
-            # Only include alerts from last 2 weeks
-            if alert_time.replace(tzinfo=None) >= two_weeks_ago:
-                alerts.append(alert)
+        for line in iter(log.readline, b''):
+            if line.strip():
+                alert = json_loads(line)
+                alert_time = datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00'))
+
+                # Only include alerts from last 2 weeks
+                if alert_time.replace(tzinfo=None) >= two_weeks_ago:
+                    alerts.append(alert)
 
 # Get unique tickers (first alert only)
 unique_tickers = {}
@@ -46,6 +90,30 @@ for alert in alerts:
     if ticker not in unique_tickers:
         unique_tickers[ticker] = alert
 
+alert_dates = {ticker: datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00')).date()
+               for ticker, alert in unique_tickers.items()}
+
+# Reuse each ticker's cached bars for its alert window
+price_data = {}
+for ticker, alert_date in alert_dates.items():
+    cached = PRICE_CACHE.load(ticker, alert_date, alert_date + timedelta(days=5), '1d')
+    if cached is not None:
+        price_data[ticker] = cached
+
+# Download the rest in batches, each covering every alert window of its tickers.
+# Batches run one after another: yf.download collects results in module-level state, so concurrent calls would mix them.
+tickers = [ticker for ticker in unique_tickers if ticker not in price_data]
+for batch_start in range(0, len(tickers), BATCH_SIZE):
+    batch = tickers[batch_start:batch_start + BATCH_SIZE]
+    start_date = min(alert_dates[ticker] for ticker in batch)
+    end_date = max(alert_dates[ticker] for ticker in batch) + timedelta(days=5)
+    for ticker, data in download_daily_prices(batch, start_date, end_date).items():
+        alert_date = alert_dates[ticker]
+        price_data[ticker] = alert_window(data, alert_date)
+        # A failed ticker comes back as an empty frame; caching it would report no data for good
+        if not price_data[ticker].empty:
+            PRICE_CACHE.store(ticker, alert_date, alert_date + timedelta(days=5), '1d', price_data[ticker])
+
 # Analyze each ticker's performance
 winners = []
 
@@ -54,10 +122,13 @@ for i, (ticker, alert) in enumerate(unique_tickers.items(), 1):
     if i % 10 == 0:
         print(f"Processed {i}/{len(unique_tickers)} tickers...")
 
-    alert_date = datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00')).date()
+    alert_date = alert_dates[ticker]
     alert_price = alert['alert_price']
 
-    max_price, max_gain = get_price_performance(ticker, alert_date, alert_price)
+    if ticker in price_data:
+        max_price, max_gain = get_price_performance(price_data[ticker], alert_date, alert_price)
+    else:
+        max_price, max_gain = None, None
 
     if max_gain is not None:
         # Convert Series to float if needed
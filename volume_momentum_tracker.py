@@ -49,11 +49,13 @@ import argparse
 import sys
 import os
 import atexit
+import io
 import requests
 import re
 import math
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 import logging
 import pytz
@@ -138,6 +140,41 @@ def get_float_shares_value(data, key='float_shares_outstanding'):
         return value
     return None
 
+# Absolute date formats, tried in order; relative times ("2 hours ago") depend on now and are parsed separately
+ABSOLUTE_DATE_PARSERS = [
+    # Method 1: RFC 2822 format (most RSS feeds)
+    lambda ds: parsedate_to_datetime(ds),
+    
+    # Method 2: ISO format with Z
+    lambda ds: datetime.fromisoformat(ds.replace('Z', '+00:00')) if 'T' in ds else None,
+    
+    # Method 3: ISO format without timezone
+    lambda ds: datetime.fromisoformat(ds) if 'T' in ds else None,
+    
+    # Method 4: Common formats
+    lambda ds: datetime.strptime(ds, '%Y-%m-%d %H:%M:%S'),
+    lambda ds: datetime.strptime(ds, '%Y-%m-%d'),
+    lambda ds: datetime.strptime(ds, '%d %b %Y %H:%M:%S'),
+    lambda ds: datetime.strptime(ds, '%d %b %Y'),
+    lambda ds: datetime.strptime(ds, '%B %d, %Y'),
+    lambda ds: datetime.strptime(ds, '%b %d, %Y'),
+]
+
+@lru_cache(maxsize=16384)
+def parse_absolute_date(date_string):
+    """
+    Parse a date string with the absolute formats, returning (method number, datetime) or (None, None)
+    Cached because news feeds repeat the same pubDate strings across items and scans
+    """
+    for i, parse_method in enumerate(ABSOLUTE_DATE_PARSERS):
+        try:
+            result = parse_method(date_string)
+            if result:
+                return i + 1, result
+        except Exception:
+            continue
+    return None, None
+
 class VolumeMomentumTracker:
     def __init__(self, output_dir="momentum_data", browser="firefox", telegram_bot_token=None, telegram_chat_id=None, immediate_spike_threshold=15.0, enable_paper_trading=False):
         """
@@ -180,6 +217,8 @@ class VolumeMomentumTracker:
 
         # Company name cache for better news filtering
         self.company_name_cache = {}
+        # News keywords per ticker; relevance checks rebuild them for every headline otherwise
+        self.search_keywords_cache = {}
 
         # VIX cache to avoid repeated API calls
         self.vix_cache = {}
@@ -435,6 +474,10 @@ class VolumeMomentumTracker:
         """
         Create comprehensive search keywords for news filtering
         """
+        # Check cache first
+        if ticker in self.search_keywords_cache:
+            return self.search_keywords_cache[ticker]
+        
         ticker_upper = ticker.upper()
         company_name = self._get_company_name(ticker)
         
@@ -470,7 +513,9 @@ class VolumeMomentumTracker:
                     if len(word) > 3:
                         keywords.extend([word.lower(), word.upper(), word.title()])
         
-        return list(set(keywords))  # Remove duplicates
+        keywords = list(set(keywords))  # Remove duplicates
+        self.search_keywords_cache[ticker] = keywords
+        return keywords
     
     def _is_relevant_news(self, title, ticker, keywords=None):
         """
@@ -519,38 +564,20 @@ class VolumeMomentumTracker:
         
         date_string = date_string.strip()
         
-        # List of parsing methods to try
-        parsing_methods = [
-            # Method 1: RFC 2822 format (most RSS feeds)
-            lambda ds: parsedate_to_datetime(ds),
-            
-            # Method 2: ISO format with Z
-            lambda ds: datetime.fromisoformat(ds.replace('Z', '+00:00')) if 'T' in ds else None,
-            
-            # Method 3: ISO format without timezone
-            lambda ds: datetime.fromisoformat(ds) if 'T' in ds else None,
-            
-            # Method 4: Common formats
-            lambda ds: datetime.strptime(ds, '%Y-%m-%d %H:%M:%S'),
-            lambda ds: datetime.strptime(ds, '%Y-%m-%d'),
-            lambda ds: datetime.strptime(ds, '%d %b %Y %H:%M:%S'),
-            lambda ds: datetime.strptime(ds, '%d %b %Y'),
-            lambda ds: datetime.strptime(ds, '%B %d, %Y'),
-            lambda ds: datetime.strptime(ds, '%b %d, %Y'),
-            
-            # Method 5: Parse relative times ("2 hours ago", "1 day ago")
-            lambda ds: self._parse_relative_time(ds),
-        ]
+        method_number, result = parse_absolute_date(date_string)
+        if result:
+            logger.debug(f"Date parsing method {method_number} succeeded for {ticker}: {result}")
+            return result
         
-        for i, parse_method in enumerate(parsing_methods):
-            try:
-                result = parse_method(date_string)
-                if result:
-                    logger.debug(f"Date parsing method {i+1} succeeded for {ticker}: {result}")
-                    return result
-            except Exception as e:
-                logger.debug(f"Date parsing method {i+1} failed for {ticker}: {e}")
-                continue
+        # Method 5: Parse relative times ("2 hours ago", "1 day ago"); never cached since it depends on now
+        relative_method_number = len(ABSOLUTE_DATE_PARSERS) + 1
+        try:
+            result = self._parse_relative_time(date_string)
+            if result:
+                logger.debug(f"Date parsing method {relative_method_number} succeeded for {ticker}: {result}")
+                return result
+        except Exception as e:
+            logger.debug(f"Date parsing method {relative_method_number} failed for {ticker}: {e}")
         
         # If all parsing fails, return a recent time
         logger.debug(f"All date parsing methods failed for {ticker}, using fallback")
@@ -1048,6 +1075,27 @@ class VolumeMomentumTracker:
         
         return headlines
     
+    def _iter_rss_items(self, content, limit):
+        """
+        Yield up to `limit` RSS <item> elements, parsing the feed no further than needed
+        Uses lxml when installed, otherwise the stdlib parser
+        """
+        try:
+            from lxml import etree as ET
+        except ImportError:
+            import xml.etree.ElementTree as ET
+        
+        seen = 0
+        for _, elem in ET.iterparse(io.BytesIO(content), events=('end',)):
+            if elem.tag != 'item':
+                continue
+            yield elem
+            # Drop the item's subtree once the caller is done with it
+            elem.clear()
+            seen += 1
+            if seen >= limit:
+                return
+
     def _search_google_news(self, ticker, max_headlines=3):
         """Search Google News for recent ticker news with timestamps"""
         headlines = []
@@ -1072,12 +1120,8 @@ class VolumeMomentumTracker:
             response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            # Parse RSS feed (basic XML parsing)
-            import xml.etree.ElementTree as ET
-
-            root = ET.fromstring(response.content)
-
-            for item in root.findall('.//item')[:max_headlines * 2]:  # Get more to filter by date
+            # Stream items and stop parsing once enough have been looked at
+            for item in self._iter_rss_items(response.content, max_headlines * 2):  # Get more to filter by date
                 try:
                     title_elem = item.find('title')
                     link_elem = item.find('link')